@@ -0,0 +1,92 @@
+"""
+Login throughput benchmark.
+
+Measures the latency of a cheap authenticated endpoint while a burst of
+concurrent logins hits the same instance. With password hashing on the
+event loop the probe p99 grows with the burst; with the hashing pool it
+should stay flat while the logins themselves queue up in the pool.
+
+Usage (against a running instance with an existing user):
+
+    python benchmarks/login_burst.py --login bench --password secret \
+        --burst 50 --probes 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def report(name: str, samples: list[float]) -> None:
+    print(
+        f"{name:<18} n={len(samples):<5} "
+        f"p50={percentile(samples, 0.50) * 1000:8.1f}ms "
+        f"p99={percentile(samples, 0.99) * 1000:8.1f}ms "
+        f"mean={statistics.fmean(samples) * 1000 if samples else float('nan'):8.1f}ms"
+    )
+
+
+async def login(client: httpx.AsyncClient, login_: str, password: str) -> tuple[float, int]:
+    started = time.perf_counter()
+    response = await client.post("/api/auth/token", data={"username": login_, "password": password})
+    return time.perf_counter() - started, response.status_code
+
+
+async def probe(client: httpx.AsyncClient, path: str, token: str, count: int, interval: float) -> list[float]:
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+        samples.append(time.perf_counter() - started)
+        # A failing probe measures the error path, not an authenticated request
+        response.raise_for_status()
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def main(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.burst + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        response = await client.post(
+            "/api/auth/token", data={"username": args.login, "password": args.password}
+        )
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+        baseline = await probe(client, args.probe_path, token, args.probes, args.interval)
+
+        burst_started = time.perf_counter()
+        logins = asyncio.gather(*(login(client, args.login, args.password) for _ in range(args.burst)))
+        during = await probe(client, args.probe_path, token, args.probes, args.interval)
+        results = await logins
+        burst_elapsed = time.perf_counter() - burst_started
+
+    statuses: dict[int, int] = {}
+    for _, status_code in results:
+        statuses[status_code] = statuses.get(status_code, 0) + 1
+
+    report("probe baseline", baseline)
+    report("probe during burst", during)
+    report("login", [elapsed for elapsed, _ in results])
+    print(f"logins/s: {len(results) / burst_elapsed:.1f}, statuses: {statuses}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--login", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--burst", type=int, default=50, help="Concurrent logins")
+    parser.add_argument("--probes", type=int, default=200, help="Probe requests per phase")
+    parser.add_argument("--interval", type=float, default=0.01, help="Pause between probes, seconds")
+    parser.add_argument("--probe-path", default="/api/users/me")
+    asyncio.run(main(parser.parse_args()))
@@ -10,7 +10,7 @@ from hh.lifespan import lifespan
 
 from hh.middleware import init_middleware
 
-from hh.router import router
+from hh.router import router, websocket_router
 
 
 def get_app() -> FastAPI:
@@ -36,6 +36,7 @@ def get_app() -> FastAPI:
     init_middleware(app)
 
     app.include_router(router)
+    app.include_router(websocket_router)
 
     return app
 
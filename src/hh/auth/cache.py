@@ -0,0 +1,66 @@
+import time
+from typing import Optional
+
+from hh.auth.dto import TokenPayloadDTO, UserDTO
+from hh.auth.service.token import TokenService
+from hh.config.security import settings as auth_settings
+from hh.libs.cache.tiered import TieredCache
+from hh.libs.cache.ttl import TTLCache
+from hh.libs.redis.client import redis_helper
+
+
+class CurrentUserCache:
+    """
+    Caches what get_current_user needs: decoded tokens and users by ID.
+
+    Decoded tokens are kept in process memory only, never past their expiry.
+    Users are kept without the password hash, in process memory and optionally
+    in Redis, and are invalidated by UserRepository.update.
+    """
+
+    def __init__(self):
+        self._tokens: TTLCache[str, TokenPayloadDTO] = TTLCache(
+            maxsize=auth_settings.user_cache_size,
+            ttl=auth_settings.user_cache_ttl,
+        )
+        self._users: TieredCache[UserDTO] = TieredCache(
+            namespace="auth:user",
+            model=UserDTO,
+            ttl=auth_settings.user_cache_ttl,
+            local_ttl=auth_settings.user_cache_local_ttl,
+            maxsize=auth_settings.user_cache_size,
+            redis=redis_helper if auth_settings.user_cache_redis else None,
+        )
+
+    def decode_token(self, token: str) -> Optional[TokenPayloadDTO]:
+        """
+        Verifies the token, reusing the result of earlier verifications.
+
+        Returns:
+            The payload, or None if the token is invalid or expired.
+        """
+        payload = self._tokens.get(token)
+        if payload is not None:
+            return payload
+
+        payload = TokenService.verify_token(token)
+        if payload is None:
+            return None
+
+        ttl = float(auth_settings.user_cache_ttl)
+        if payload.exp is not None:
+            ttl = min(ttl, payload.exp - time.time())
+        self._tokens.set(token, payload, ttl)
+        return payload
+
+    async def get_user(self, user_id: int) -> Optional[UserDTO]:
+        return await self._users.get(user_id)
+
+    async def set_user(self, user: UserDTO) -> None:
+        await self._users.set(user.id, user.model_copy(update={"password": None}))
+
+    async def invalidate(self, user_id: int) -> None:
+        await self._users.delete(user_id)
+
+
+user_cache = CurrentUserCache()
@@ -1,41 +1,93 @@
-from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from typing import Annotated, Optional
+from fastapi import Depends, HTTPException, Query, WebSocket, WebSocketException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from hh.auth.service.token import TokenService
+from hh.auth.cache import user_cache
 from hh.auth.dependencies.user_repository import IUserRepository
-from hh.auth.dto import UserDTO, AccessTokenDTO
+from hh.auth.dto import UserDTO
 from hh.auth.exceptions import UserNotFound
+from hh.auth.repositories.user import UserRepository
 
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
-async def get_current_user(token: AccessTokenDTO, user_repo: IUserRepository) -> UserDTO:
-    """
-    Dependency to get the current user from a JWT token.
 
-    Verifies the token, extracts the user ID, and fetches the user
-    from the database.
-
-    Raises:
-        HTTPException(401): If the token is invalid or the user is not found.
+async def resolve_user(token: str, user_repo: UserRepository) -> Optional[UserDTO]:
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    Resolves the user of a JWT token.
 
-    access_token = token.access_token
+    Verifies the token and extracts the user ID. The user is built from the
+    token's profile claims when they are embedded, otherwise read from the
+    user cache and only fetched from the database on a miss.
+    The returned user never carries the password hash.
 
-    payload = TokenService.verify_token(access_token)
+    Returns:
+        The user, or None if the token is invalid or the user is not found.
+    """
+    payload = user_cache.decode_token(token)
 
     if payload is None or payload.sub is None:
-        raise credentials_exception
+        return None
 
     user_id = int(payload.sub)
+
+    if payload.name and payload.login and payload.email:
+        return UserDTO(id=user_id, name=payload.name, login=payload.login, email=payload.email)
+
+    user = await user_cache.get_user(user_id)
+    if user is not None:
+        return user
+
     try:
         user = await user_repo.get(user_id) #TODO restrict using repository from interface level, instead use service
-        return user
     except UserNotFound:
-        raise credentials_exception
+        return None
+
+    await user_cache.set_user(user)
+    return user.model_copy(update={"password": None})
+
+
+async def get_current_user(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        user_repo: IUserRepository
+) -> UserDTO:
+    """
+    Dependency to get the current user from a JWT token.
+
+    Raises:
+        HTTPException(401): If the token is invalid or the user is not found.
+    """
+    user = await resolve_user(token, user_repo)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+async def get_current_ws_user(
+        websocket: WebSocket,
+        user_repo: IUserRepository,
+        token: Annotated[Optional[str], Query()] = None,
+) -> UserDTO:
+    """
+    Dependency to get the current user of a WebSocket connection.
+
+    Browsers cannot set headers on WebSocket handshakes, so the token is read
+    from the 'token' query parameter, falling back to the Authorization header.
+
+    Raises:
+        WebSocketException(1008): If the token is missing or invalid.
+    """
+    if token is None:
+        scheme, _, credentials = websocket.headers.get("Authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+
+    user = await resolve_user(token, user_repo) if token else None
+    if user is None:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Could not validate credentials")
+    return user
 
-ICurrentUser: type[UserDTO] = Annotated[UserDTO, Depends(get_current_user)]
\ No newline at end of file
+ICurrentUser: type[UserDTO] = Annotated[UserDTO, Depends(get_current_user)]
+ICurrentWSUser: type[UserDTO] = Annotated[UserDTO, Depends(get_current_ws_user)]
@@ -14,8 +14,13 @@ class TokenPayloadDTO(BaseModel):
     """
     DTO for the payload data encoded within the JWT.
     'sub' (subject) will typically be the user's ID.
+    Profile fields are present when profile claims are embedded.
     """
     sub: str | None = None
+    exp: int | None = None
+    name: str | None = None
+    login: str | None = None
+    email: str | None = None
 
 class AccessTokenDTO(BaseModel):
     """
@@ -26,7 +31,7 @@ class AccessTokenDTO(BaseModel):
 
 #User
 
-from typing import Optional, Annotated
+from typing import Optional, Annotated, List
 from pydantic import BaseModel, EmailStr, StringConstraints
 
 class UserDTO(BaseModel):
@@ -46,6 +51,13 @@ class PublicUserDTO(BaseModel):
     """
     name: Annotated[str, StringConstraints(max_length=30)]
 
+class UserPageDTO(BaseModel):
+    """
+    A page of public user profiles with the cursor of the next page.
+    """
+    items: List[PublicUserDTO]
+    next_cursor: Optional[str] = None
+
 class PrivateUserDTO(BaseModel):
     """
     A private view of a user's data, excluding sensitive details like the password.
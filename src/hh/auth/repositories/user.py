@@ -1,12 +1,13 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 
 from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 
+from hh.auth.cache import user_cache
 from hh.auth.exceptions import UserAlreadyExist, UserNotFound
 from hh.config.database.session import ISession
 from hh.auth.models.user import UserModel
-from hh.auth.dto import UpdateUserDTO, UserDTO, FindUserDTO
+from hh.auth.dto import UpdateUserDTO, UserDTO, FindUserDTO, PublicUserDTO
 
 
 class UserRepository:
@@ -47,11 +48,31 @@ class UserRepository:
             raise UserNotFound
         return self._get_dto(instance)
 
-    async def get_list(self, limit: int = 100, offset: int = 0) -> List[UserDTO]:
-        stmt = select(UserModel).offset(offset).limit(limit)
+    async def get_public_page(self, limit: int = 100, after_id: Optional[int] = None) -> List[tuple[int, PublicUserDTO]]:
+        """
+        Keyset page of public profiles ordered by id, selecting only the public columns.
+
+        Returns:
+            Pairs of (id, profile); the last id is the key of the next page.
+        """
+        stmt = select(UserModel.id, UserModel.name).order_by(UserModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(UserModel.id > after_id)
         result = await self.session.execute(stmt)
-        instances = result.scalars().all()
-        return [self._get_dto(instance) for instance in instances]
+        return [(row.id, PublicUserDTO(name=row.name)) for row in result]
+
+    async def stream_public(self, batch_size: int = 1000) -> AsyncIterator[PublicUserDTO]:
+        """
+        Streams all public profiles through a server-side cursor.
+        """
+        stmt = (
+            select(UserModel.name)
+            .order_by(UserModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for name in result:
+            yield PublicUserDTO(name=name)
 
     async def update(self, dto: UpdateUserDTO, pk: int) -> UserDTO:
         stmt = (
@@ -65,6 +86,7 @@ class UserRepository:
         instance = result.scalar_one_or_none()
         if instance is None:
             raise UserNotFound
+        await user_cache.invalidate(pk)
         return self._get_dto(instance)
 
     @staticmethod
@@ -4,6 +4,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from hh.auth.dependencies.service import IAuthService
 from hh.auth.exceptions import UserNotFound
+from hh.auth.service.password import password_executor
+from hh.libs.exceptions import Overloaded
 from hh.auth.dto import TokenDTO
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -25,4 +27,18 @@ async def login_for_access_token(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+    except Overloaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, try again later",
+            headers={"Retry-After": "1"},
+        )
+
+
+@router.get("/executor", summary="Load of the password hashing pool")
+async def get_password_executor_stats() -> dict:
+    """
+    Counters of the thread pool running bcrypt for logins and registrations.
+    """
+    return password_executor.snapshot()
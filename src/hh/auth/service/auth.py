@@ -6,6 +6,7 @@ from hh.auth.exceptions import UserNotFound
 from hh.auth.service.password import PasswordService
 from hh.auth.service.token import TokenService
 from hh.auth.dto import TokenDTO
+from hh.config.security import settings as auth_settings
 
 class AuthService:
     """
@@ -31,10 +32,14 @@ class AuthService:
         if not user:
             raise UserNotFound
 
-        if not PasswordService.verify_password(form_data.password, user.password):
+        if not await PasswordService.verify_password(form_data.password, user.password):
             raise UserNotFound
 
-        access_token = TokenService.create_access_token(data={"sub": str(user.id)})
+        claims = {"sub": str(user.id)}
+        if auth_settings.embed_profile_claims:
+            claims.update(name=user.name, login=user.login, email=user.email)
+
+        access_token = TokenService.create_access_token(data=claims)
         refresh_token = TokenService.create_refresh_token(data={"sub": str(user.id)})
 
         return TokenDTO(access_token=access_token, refresh_token=refresh_token)
@@ -1,15 +1,28 @@
 from passlib.context import CryptContext
 
+from hh.config.security import settings as auth_settings
+from hh.libs.executor import BoundedExecutor
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt takes 100+ ms per call, so it never runs on the event loop
+password_executor = BoundedExecutor(
+    "password-hash",
+    max_workers=auth_settings.password_hash_workers,
+    max_queue=auth_settings.password_hash_queue,
+)
+
 class PasswordService:
     """
     Provides services for password hashing and verification.
+
+    Both operations run in a bounded thread pool and raise Overloaded
+    when its queue is full.
     """
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await password_executor.run(pwd_context.verify, plain_password, hashed_password)
 
     @staticmethod
-    def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password)
\ No newline at end of file
+    async def get_password_hash(password: str) -> str:
+        return await password_executor.run(pwd_context.hash, password)
@@ -14,25 +14,25 @@ class TokenService:
     def create_access_token(data: dict) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + timedelta(
-            minutes=auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES
+            minutes=auth_settings.access_token_expire_minutes
         )
         to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, auth_settings.SECRET_KEY, algorithm=auth_settings.ALGORITHM)
+        return jwt.encode(to_encode, auth_settings.secret_key, algorithm=auth_settings.algorithm)
 
     @staticmethod
     def create_refresh_token(data: dict) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + timedelta(
-            days=auth_settings.REFRESH_TOKEN_EXPIRE_DAYS
+            days=auth_settings.refresh_token_expire_days
         )
         to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, auth_settings.SECRET_KEY, algorithm=auth_settings.ALGORITHM)
+        return jwt.encode(to_encode, auth_settings.secret_key, algorithm=auth_settings.algorithm)
 
     @staticmethod
     def verify_token(token: str) -> Optional[TokenPayloadDTO]:
         try:
             payload = jwt.decode(
-                token, auth_settings.SECRET_KEY, algorithms=[auth_settings.ALGORITHM]
+                token, auth_settings.secret_key, algorithms=[auth_settings.algorithm]
             )
             return TokenPayloadDTO(**payload)
         except JWTError:
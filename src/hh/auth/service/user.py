@@ -1,11 +1,14 @@
-from typing import List
+from typing import AsyncIterator, Optional
 
 from hh.libs.exceptions import PaginationError
+from hh.libs.pagination import encode_cursor, decode_cursor
 from hh.auth.dependencies.user_repository import IUserRepository
-from hh.auth.dto import UserDTO, PublicUserDTO, PrivateUserDTO
+from hh.auth.dto import UserDTO, PublicUserDTO, PrivateUserDTO, UserPageDTO
 from hh.auth.service.password import PasswordService
 
 class UserService:
+    MAX_PAGE_SIZE = 1000
+
     def __init__(self, user_repository: IUserRepository):
         self.repository = user_repository
 
@@ -13,7 +16,7 @@ class UserService:
         """
         Creates a new user, correctly hashing the password before saving.
         """
-        hashed_password = PasswordService.get_password_hash(dto.password)
+        hashed_password = await PasswordService.get_password_hash(dto.password)
         dto.password = hashed_password
 
         created_user = await self.repository.create(dto)
@@ -31,8 +34,27 @@ class UserService:
         user = await self.repository.get(pk)
         return PrivateUserDTO(name=user.name, login=user.login, email=user.email)
 
-    async def get_users_list(self, limit: int = 100, offset: int = 0) -> List[PublicUserDTO]:
-        if limit < 0 or offset < 0:
-            raise PaginationError("Limit and offset must be non-negative")
-        users = await self.repository.get_list(limit, offset)
-        return [PublicUserDTO(name=user.name) for user in users]
+    async def get_users_page(self, limit: int = 100, cursor: Optional[str] = None) -> UserPageDTO:
+        """
+        Returns a page of public profiles after the cursor.
+        """
+        if limit <= 0 or limit > self.MAX_PAGE_SIZE:
+            raise PaginationError(f"Limit must be between 1 and {self.MAX_PAGE_SIZE}")
+        after_id = None
+        if cursor:
+            (value,) = decode_cursor(cursor, 1)
+            try:
+                after_id = int(value)
+            except (TypeError, ValueError):
+                raise PaginationError("Invalid cursor")
+
+        rows = await self.repository.get_public_page(limit + 1, after_id)
+        next_cursor = encode_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+        return UserPageDTO(items=[user for _, user in rows[:limit]], next_cursor=next_cursor)
+
+    async def export_users(self) -> AsyncIterator[str]:
+        """
+        Yields all public profiles as NDJSON lines.
+        """
+        async for user in self.repository.stream_public():
+            yield user.model_dump_json() + "\n"
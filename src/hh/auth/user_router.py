@@ -1,24 +1,41 @@
-from fastapi import APIRouter, status
-from typing import List
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
 
 from hh.auth.dependencies.user_service import IUserService
-from hh.auth.dto import UserDTO, PublicUserDTO, PrivateUserDTO
+from hh.auth.dto import UserDTO, PublicUserDTO, PrivateUserDTO, UserPageDTO
 from hh.auth.dependencies.current_user import ICurrentUser
+from hh.libs.exceptions import Overloaded, PaginationError
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=PrivateUserDTO)
 async def register_user(user_data: UserDTO, service: IUserService):
-    return await service.create_user_with_hashed_password(user_data)
+    try:
+        return await service.create_user_with_hashed_password(user_data)
+    except Overloaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent registrations, try again later",
+            headers={"Retry-After": "1"},
+        )
 
-@router.get("/{user_id}", response_model=PublicUserDTO)
-async def get_user_public_profile(user_id: int, service: IUserService):
-    return await service.get_user_public_profile(user_id)
-
-@router.get("/", response_model=List[PublicUserDTO])
-async def get_all_users(service: IUserService, limit: int = 100, offset: int = 0):
-    return await service.get_users_list(limit, offset)
+@router.get("/export", summary="Export all users as NDJSON")
+async def export_users(service: IUserService):
+    return StreamingResponse(service.export_users(), media_type="application/x-ndjson")
 
+# Declared before /{user_id}, which would otherwise match "me"
 @router.get("/me", response_model=PrivateUserDTO, summary="Get current user profile")
 async def read_users_me(current_user: ICurrentUser):
     return PrivateUserDTO(name=current_user.name, login=current_user.login, email=current_user.email)
+
+@router.get("/{user_id}", response_model=PublicUserDTO)
+async def get_user_public_profile(user_id: int, service: IUserService):
+    return await service.get_user_public_profile(user_id)
+
+@router.get("/", response_model=UserPageDTO)
+async def get_all_users(service: IUserService, limit: int = 100, cursor: Optional[str] = None):
+    try:
+        return await service.get_users_page(limit, cursor)
+    except PaginationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,21 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    """
+    Read-through caches of per-user data, read from environment variables.
+    """
+    # Search settings and HH profile
+    vacancy_cache_ttl: int = Field(300, alias="VACANCY_CACHE_TTL")
+    vacancy_cache_local_ttl: int = Field(10, alias="VACANCY_CACHE_LOCAL_TTL")
+    vacancy_cache_size: int = Field(10_000, alias="VACANCY_CACHE_SIZE")
+    vacancy_cache_redis: bool = Field(True, alias="VACANCY_CACHE_REDIS")
+
+    # HH resumes: served as is while fresh, served and refreshed in the background while stale
+    resume_cache_fresh_ttl: int = Field(600, alias="RESUME_CACHE_FRESH_TTL")
+    resume_cache_stale_ttl: int = Field(86_400, alias="RESUME_CACHE_STALE_TTL")
+    resume_refresh_lock_ttl: int = Field(60, alias="RESUME_REFRESH_LOCK_TTL")
+
+
+settings = Settings()
@@ -1,5 +1,13 @@
 from celery import Celery
+from kombu import Exchange, Queue
 from hh.config.redis import settings as redis_settings
+from hh.config.worker import settings as worker_settings
+from hh.config.headhunter import settings as hh_settings
+
+# Manual starts and other user-facing tasks, served by dedicated workers
+INTERACTIVE_QUEUE = "interactive"
+# Scheduled runs and their dispatch
+BULK_QUEUE = "bulk"
 
 celery_app = Celery(
     "hh_automator",
@@ -14,4 +22,31 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
-)
\ No newline at end of file
+    task_queues=(
+        Queue(INTERACTIVE_QUEUE, Exchange(INTERACTIVE_QUEUE), routing_key=INTERACTIVE_QUEUE),
+        Queue(BULK_QUEUE, Exchange(BULK_QUEUE), routing_key=BULK_QUEUE),
+    ),
+    task_default_queue=BULK_QUEUE,
+    task_routes={
+        "hh.worker.tasks.refresh_user_resumes": {"queue": INTERACTIVE_QUEUE},
+        "hh.worker.tasks.sync_user_negotiations": {"queue": INTERACTIVE_QUEUE},
+    },
+    # Runs are long: take one message at a time, so queued runs stay with the
+    # broker instead of waiting behind a busy process, and acknowledge after
+    # completion so a lost worker's run is redelivered
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    broker_transport_options={"visibility_timeout": worker_settings.visibility_timeout},
+)
+
+celery_app.conf.beat_schedule = {
+    "dispatch-scheduled-runs": {
+        "task": "hh.worker.tasks.dispatch_scheduled_runs",
+        "schedule": worker_settings.dispatch_interval,
+    },
+    "refresh-hh-dictionaries": {
+        "task": "hh.worker.tasks.refresh_hh_dictionaries",
+        "schedule": hh_settings.dictionaries_refresh_interval,
+    },
+}
@@ -11,5 +11,14 @@ class Settings(BaseSettings):
     auth_url: str = "https://hh.ru/oauth/authorize"
     token_url: str = "https://hh.ru/oauth/token"
 
+    # Request rates to the HH API shared by all API and worker processes, per second:
+    # in total, and of a single HH account
+    rate_limit: float = Field(20, alias="HH_RATE_LIMIT")
+    account_rate_limit: float = Field(5, alias="HH_ACCOUNT_RATE_LIMIT")
+
+    # Local snapshot of /areas and /dictionaries, shared by the API and the workers
+    dictionaries_path: str = Field("/var/lib/hh/dictionaries.json", alias="HH_DICTIONARIES_PATH")
+    dictionaries_refresh_interval: int = Field(86_400, alias="HH_DICTIONARIES_REFRESH_INTERVAL")
+
 
 settings = Settings()
\ No newline at end of file
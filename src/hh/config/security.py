@@ -5,7 +5,21 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     secret_key: str = Field(..., alias="SECRET_KEY")
     access_token_expire_minutes: int = Field(..., alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    refresh_token_expire_days: int = Field(30, alias="REFRESH_TOKEN_EXPIRE_DAYS")
     algorithm: str = Field("HS256", alias="SECRET_KEY_ALGORITHM")
 
+    # Current user cache
+    user_cache_ttl: int = Field(60, alias="USER_CACHE_TTL")
+    user_cache_local_ttl: int = Field(10, alias="USER_CACHE_LOCAL_TTL")
+    user_cache_size: int = Field(10_000, alias="USER_CACHE_SIZE")
+    user_cache_redis: bool = Field(False, alias="USER_CACHE_REDIS")
+    # Put name, login and email into access tokens so most requests skip the DB.
+    # Embedded fields may be stale for up to the access token lifetime after a profile update.
+    embed_profile_claims: bool = Field(False, alias="EMBED_PROFILE_CLAIMS")
+
+    # Password hashing pool; bcrypt releases the GIL, so threads run in parallel
+    password_hash_workers: int = Field(4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_queue: int = Field(64, alias="PASSWORD_HASH_QUEUE")
+
 
 settings = Settings()
@@ -0,0 +1,45 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    """
+    Tuning of the auto-apply worker, read from environment variables.
+    """
+    # Near-duplicate detection of reposted vacancies
+    near_duplicate_window_days: int = Field(30, alias="WORKER_NEAR_DUPLICATE_WINDOW_DAYS")
+    near_duplicate_max_distance: int = Field(3, alias="WORKER_NEAR_DUPLICATE_MAX_DISTANCE")
+
+    # HH daily limit of negotiations per account, reported as the remaining quota
+    daily_application_limit: int = Field(200, alias="WORKER_DAILY_APPLICATION_LIMIT")
+
+
+    # Periodic runs: every interval active users are enqueued in batches spread over it
+    dispatch_interval: int = Field(300, alias="WORKER_DISPATCH_INTERVAL")
+    dispatch_batch_size: int = Field(500, alias="WORKER_DISPATCH_BATCH_SIZE")
+    run_lock_ttl: int = Field(3600, alias="WORKER_RUN_LOCK_TTL")
+    # A run still queued after this many seconds is assumed lost and enqueued again;
+    # never shorter than the visibility timeout, so a backlog is not re-enqueued every tick
+    queued_timeout: int = Field(7200, alias="WORKER_QUEUED_TIMEOUT")
+
+    # Budget of one run slice; a run exceeding it is checkpointed and re-enqueued
+    run_time_budget: int = Field(600, alias="WORKER_RUN_TIME_BUDGET")
+    run_application_budget: int = Field(50, alias="WORKER_RUN_APPLICATION_BUDGET")
+    # Unacknowledged messages are redelivered after this many seconds, must exceed the longest run
+    visibility_timeout: int = Field(7200, alias="WORKER_VISIBILITY_TIMEOUT")
+
+    # Adaptive schedule: the interval between a user's runs, in seconds, grows after
+    # runs without new vacancies and shrinks after runs with at least the target yield
+    schedule_initial_interval: int = Field(3600, alias="WORKER_SCHEDULE_INITIAL_INTERVAL")
+    schedule_min_interval: int = Field(900, alias="WORKER_SCHEDULE_MIN_INTERVAL")
+    schedule_max_interval: int = Field(86_400, alias="WORKER_SCHEDULE_MAX_INTERVAL")
+    schedule_factor: float = Field(2.0, alias="WORKER_SCHEDULE_FACTOR")
+    schedule_target_yield: int = Field(20, alias="WORKER_SCHEDULE_TARGET_YIELD")
+
+
+    @property
+    def effective_queued_timeout(self) -> int:
+        return max(self.queued_timeout, self.visibility_timeout)
+
+
+settings = Settings()
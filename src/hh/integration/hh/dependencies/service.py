@@ -1,12 +1,28 @@
-from typing import AsyncGenerator, Annotated
+from typing import Annotated
 from fastapi import Depends
 from hh.integration.hh.service import HHIntegrationService
 
-async def get_hh_service() -> AsyncGenerator[HHIntegrationService, None]:
-    service = HHIntegrationService()
-    try:
-        yield service
-    finally:
-        await service.close()
+_service: HHIntegrationService | None = None
 
-IHHService: type[HHIntegrationService] = Annotated[HHIntegrationService, Depends(get_hh_service)]
\ No newline at end of file
+
+def get_hh_service() -> HHIntegrationService:
+    """
+    Returns the process-wide HH service, so requests share one connection pool.
+
+    The pool is bound to the application's event loop and closed on shutdown
+    by close_hh_service.
+    """
+    global _service
+    if _service is None:
+        _service = HHIntegrationService()
+    return _service
+
+
+async def close_hh_service() -> None:
+    global _service
+    if _service is not None:
+        await _service.close()
+        _service = None
+
+
+IHHService: type[HHIntegrationService] = Annotated[HHIntegrationService, Depends(get_hh_service)]
@@ -1,4 +1,5 @@
 # /home/jj/code/HeadHunterAutoApplier/src/hh/integration/hh/dto.py
+from datetime import datetime
 from typing import Optional, List, Any
 from pydantic import BaseModel, Field
 
@@ -8,6 +9,11 @@ class HHVacancyItemDTO(BaseModel):
     salary: Optional[dict[str, Any]] = None
     employer: dict[str, Any]
     alternate_url: str
+    has_test: bool = False
+    response_letter_required: bool = False
+    archived: bool = False
+    snippet: Optional[dict[str, Any]] = None
+    published_at: Optional[datetime] = None
 
 class HHSearchResultsDTO(BaseModel):
     items: List[HHVacancyItemDTO]
@@ -15,6 +21,19 @@ class HHSearchResultsDTO(BaseModel):
     pages: int
     page: int
 
+class HHNegotiationDTO(BaseModel):
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    # Null when the vacancy has been deleted
+    vacancy: Optional[dict[str, Any]] = None
+
+class HHNegotiationsPageDTO(BaseModel):
+    items: List[HHNegotiationDTO]
+    found: int
+    pages: int
+    page: int
+
 class HHNegotiationPayloadDTO(BaseModel):
     vacancy_id: str
     resume_id: str
@@ -25,4 +44,24 @@ class HHTokenDTO(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str
-    expires_in: int
\ No newline at end of file
+    expires_in: int
+class HHSearchWindowDTO(BaseModel):
+    """Publication date range of a search partition; open ends are not sent."""
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+class HHSearchCursorDTO(BaseModel):
+    """Position in a partitioned search: the partitions left, starting with the current one, and its page."""
+    windows: List[HHSearchWindowDTO]
+    page: int = 0
+
+    def next(self, pages: int) -> "HHSearchCursorDTO":
+        """
+        Position after the current page.
+
+        Args:
+            pages: Number of pages of the current partition.
+        """
+        if self.page + 1 < pages:
+            return HHSearchCursorDTO(windows=self.windows, page=self.page + 1)
+        return HHSearchCursorDTO(windows=self.windows[1:], page=0)
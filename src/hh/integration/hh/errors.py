@@ -0,0 +1,68 @@
+import json
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import Optional
+
+from hh.libs.http.exceptions import HttpStatusCodeError
+
+
+ALREADY_APPLIED = "already_applied"
+VACANCY_NOT_FOUND = "vacancy_not_found"
+
+
+class FailureScope(StrEnum):
+    """Who a permanent negotiation failure applies to."""
+    USER = "user"
+    VACANCY = "vacancy"
+
+
+@dataclass(frozen=True)
+class FailurePolicy:
+    scope: FailureScope
+    ttl: timedelta
+
+
+# Negotiation errors that will fail again on every retry, with how long to remember them.
+# Vacancy-level failures are shared by every user, user-level ones only by the user who hit them.
+FAILURE_POLICIES: dict[str, FailurePolicy] = {
+    "vacancy_archived": FailurePolicy(FailureScope.VACANCY, timedelta(days=90)),
+    "archived": FailurePolicy(FailureScope.VACANCY, timedelta(days=90)),
+    VACANCY_NOT_FOUND: FailurePolicy(FailureScope.VACANCY, timedelta(days=90)),
+    "test_required": FailurePolicy(FailureScope.VACANCY, timedelta(days=30)),
+    "in_a_black_list": FailurePolicy(FailureScope.USER, timedelta(days=30)),
+    "conditions_not_met": FailurePolicy(FailureScope.USER, timedelta(days=14)),
+    "letter_required": FailurePolicy(FailureScope.USER, timedelta(days=7)),
+}
+
+
+def classify_negotiation_error(error: HttpStatusCodeError) -> Optional[str]:
+    """
+    Extracts the HH error value from a failed POST /negotiations response.
+
+    Args:
+        error: The raised HTTP status error.
+
+    Returns:
+        The HH error value (e.g. 'already_applied', 'test_required') or None
+        if the response does not describe a known negotiation error.
+    """
+    if error.status_code == 404:
+        return VACANCY_NOT_FOUND
+
+    if error.status_code not in (400, 403):
+        return None
+
+    try:
+        body_json = json.loads(error.response_body or "{}")
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(body_json, dict):
+        return None
+
+    for err in body_json.get("errors", []):
+        value = err.get("value")
+        if value == ALREADY_APPLIED or value in FAILURE_POLICIES:
+            return value
+    return None
@@ -0,0 +1,229 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional
+
+from hh.integration.hh.dto import HHSearchResultsDTO, HHSearchWindowDTO, HHSearchCursorDTO
+from hh.libs.http.exceptions import UnauthorizedError
+
+if TYPE_CHECKING:
+    from hh.integration.hh.service import HHIntegrationService
+
+# HH returns at most this many results of a query, however it is paged
+MAX_RESULTS = 2000
+MAX_PER_PAGE = 100
+# Most recent publication period split when a query is over the cap; older
+# vacancies form an open-ended partition, which is cut the same way if needed
+SEARCH_PERIOD = timedelta(days=30)
+# Windows are never split into halves shorter than this, the excess results
+# of a window that cannot be split are lost
+MIN_WINDOW = timedelta(minutes=1)
+
+_DONE = object()
+
+
+@dataclass
+class SearchPartition:
+    """
+    A sub-query of a search, with the first page fetched while planning if it
+    is kept (only for the first partition).
+    """
+    window: HHSearchWindowDTO
+    first_page: Optional[HHSearchResultsDTO] = None
+
+
+class SearchPlanner:
+    """
+    Splits a search whose results exceed HH's pagination cap into disjoint
+    publication date windows, each small enough to be paged to the end.
+
+    A query is probed with its first page; while it finds more than MAX_RESULTS
+    its window is halved and both halves are probed concurrently. Probes are
+    full pages; the first page of the most recent leaf is reused, so a query
+    under the cap costs no extra request, while the first pages of the other
+    leaves are dropped and fetched again in their turn, so a plan does not
+    hold a page per partition. Vacancies republished while a run pages through
+    the windows may be seen twice, so consumers deduplicate IDs.
+    """
+
+    def __init__(
+            self,
+            hh_service: "HHIntegrationService",
+            token: str,
+            text: str,
+            filters: dict[str, Any],
+            concurrency: int = 4,
+            on_unauthorized: Optional[Callable[[str], Awaitable[str]]] = None
+    ):
+        """
+        Args:
+            hh_service: Service to communicate with HH.
+            token: Valid access token.
+            text: Search query string.
+            filters: Additional query parameters (area, salary, etc).
+            concurrency: Maximum number of probes in flight.
+            on_unauthorized: Called once when a search is rejected with 401
+                with the rejected token, returns a fresh access token to retry with.
+        """
+        self.hh_service = hh_service
+        self.token = token
+        self.on_unauthorized = on_unauthorized
+        self.text = text
+        self.filters = filters
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._refresh_lock = asyncio.Lock()
+
+    async def fetch_page(self, window: HHSearchWindowDTO, page: int) -> HHSearchResultsDTO:
+        """
+        Fetches one page of a partition, refreshing the token through the
+        callback on 401.
+
+        Raises:
+            UnauthorizedError: If the token is rejected and cannot be refreshed.
+        """
+        # The token the request is sent with, self.token may change while it waits
+        token = self.token
+        try:
+            return await self._search(window, page, token)
+        except UnauthorizedError:
+            if self.on_unauthorized is None:
+                raise
+        async with self._refresh_lock:
+            # Concurrent probes refresh once
+            if self.token == token:
+                self.token = await self.on_unauthorized(token)
+        return await self._search(window, page, self.token)
+
+    async def _search(self, window: HHSearchWindowDTO, page: int, token: str) -> HHSearchResultsDTO:
+        async with self._semaphore:
+            return await self.hh_service.search_vacancies(
+                token=token,
+                text=self.text,
+                page=page,
+                per_page=MAX_PER_PAGE,
+                date_from=window.date_from.isoformat(timespec="seconds") if window.date_from else None,
+                date_to=window.date_to.isoformat(timespec="seconds") if window.date_to else None,
+                **self.filters
+            )
+
+    async def plan(self) -> list[SearchPartition]:
+        """
+        Probes the search and splits it until every partition is under the cap.
+
+        Returns:
+            Partitions from the most recent publication window to the oldest.
+
+        Raises:
+            UnauthorizedError: If the token is rejected and cannot be refreshed.
+        """
+        root = await self.fetch_page(HHSearchWindowDTO(), 0)
+        if root.found <= MAX_RESULTS:
+            return [SearchPartition(HHSearchWindowDTO(), root)]
+
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        return await self._split_open(now, True)
+
+    async def _split_open(self, date_to: datetime, keep_first_page: bool) -> list[SearchPartition]:
+        # An open-ended window can't be halved: its last SEARCH_PERIOD is split,
+        # everything published before that is probed as a new open-ended window
+        date_from = date_to - SEARCH_PERIOD
+        recent, older = await asyncio.gather(
+            self._split(HHSearchWindowDTO(date_from=date_from, date_to=date_to), keep_first_page),
+            self._probe(HHSearchWindowDTO(date_to=date_from), False),
+        )
+        return recent + older
+
+    async def _split(self, window: HHSearchWindowDTO, keep_first_page: bool) -> list[SearchPartition]:
+        # Whole seconds, HH does not accept fractional dates
+        seconds = (window.date_to - window.date_from) // timedelta(seconds=2)
+        middle = window.date_from + timedelta(seconds=seconds)
+        halves = (
+            HHSearchWindowDTO(date_from=middle, date_to=window.date_to),
+            HHSearchWindowDTO(date_from=window.date_from, date_to=middle),
+        )
+        # Only the most recent half can contain the first partition
+        planned = await asyncio.gather(self._probe(halves[0], keep_first_page), self._probe(halves[1], False))
+        return [partition for partitions in planned for partition in partitions]
+
+    async def _probe(self, window: HHSearchWindowDTO, keep_first_page: bool) -> list[SearchPartition]:
+        first_page = await self.fetch_page(window, 0)
+        if first_page.found > MAX_RESULTS and window.date_from is None:
+            return await self._split_open(window.date_to, keep_first_page)
+        if first_page.found <= MAX_RESULTS or window.date_to - window.date_from < 2 * MIN_WINDOW:
+            return [SearchPartition(window, first_page if keep_first_page else None)]
+        return await self._split(window, keep_first_page)
+
+    async def iter_pages(
+            self,
+            cursor: Optional[HHSearchCursorDTO] = None,
+            lookahead: int = 1
+    ) -> AsyncIterator[tuple[HHSearchCursorDTO, HHSearchResultsDTO]]:
+        """
+        Yields the pages of every partition in turn, planning the search first.
+
+        Pages are fetched by a background task up to lookahead pages ahead of
+        the consumer, so at most lookahead + 1 pages are held at a time.
+        Vacancies already yielded in the current or previous partition are
+        removed from the pages, which may leave pages empty.
+
+        Args:
+            cursor: Position to continue from, e.g. a checkpoint of an earlier
+                run; the search is planned anew without it.
+            lookahead: Number of pages fetched ahead of the consumer.
+
+        Yields:
+            The position of every page and the page itself.
+
+        Raises:
+            UnauthorizedError: If the token is rejected and cannot be refreshed.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=lookahead)
+        producer = asyncio.create_task(self._produce(queue, cursor))
+        previous_ids: set[str] = set()
+        current_ids: set[str] = set()
+        current_window: Optional[HHSearchWindowDTO] = None
+
+        try:
+            while True:
+                entry = await queue.get()
+                if entry is _DONE:
+                    return
+                if isinstance(entry, BaseException):
+                    raise entry
+
+                position, results = entry
+                if position.windows[0] is not current_window:
+                    current_window = position.windows[0]
+                    previous_ids, current_ids = current_ids, set()
+
+                items = [
+                    item for item in results.items
+                    if item.id not in current_ids and item.id not in previous_ids
+                ]
+                current_ids.update(item.id for item in items)
+                yield position, results.model_copy(update={"items": items})
+        finally:
+            producer.cancel()
+
+    async def _produce(self, queue: asyncio.Queue, cursor: Optional[HHSearchCursorDTO]) -> None:
+        try:
+            if cursor is None:
+                partitions = await self.plan()
+                cursor = HHSearchCursorDTO(windows=[partition.window for partition in partitions])
+                first_page = partitions[0].first_page
+            else:
+                first_page = None
+
+            while cursor.windows:
+                if first_page is not None:
+                    results, first_page = first_page, None
+                else:
+                    results = await self.fetch_page(cursor.windows[0], cursor.page)
+
+                await queue.put((cursor, results))
+                cursor = cursor.next(results.pages if results.items else 0)
+            await queue.put(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
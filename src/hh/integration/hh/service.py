@@ -1,9 +1,30 @@
+import hashlib
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 from urllib.parse import urlencode
 
 from hh.libs.http.client import AsyncHttpClient
-from hh.integration.hh.dto import HHSearchResultsDTO, HHNegotiationPayloadDTO, HHTokenDTO
+from hh.libs.http.throttler import RedisFairThrottler
+from hh.libs.redis.client import redis_helper
+from hh.integration.hh.dto import (
+    HHSearchResultsDTO,
+    HHSearchCursorDTO,
+    HHNegotiationPayloadDTO,
+    HHNegotiationsPageDTO,
+    HHTokenDTO,
+    HHVacancyItemDTO,
+)
+from hh.integration.hh.planner import SearchPlanner
 from hh.config.headhunter import settings as hh_settings
 
+# One queue for HH requests of every process, so accounts are balanced fleet-wide
+hh_throttler = RedisFairThrottler(
+    redis_helper,
+    namespace="hh:throttle",
+    rate=hh_settings.rate_limit,
+    flow_rate=hh_settings.account_rate_limit,
+)
+
 
 class HHIntegrationService:
     """
@@ -18,7 +39,7 @@ class HHIntegrationService:
         Args:
             http_client: Optional AsyncHttpClient instance.
         """
-        self.client = http_client or AsyncHttpClient(base_url=self.BASE_URL)
+        self.client = http_client or AsyncHttpClient(base_url=self.BASE_URL, throttler=hh_throttler)
 
     async def close(self):
         """
@@ -29,6 +50,11 @@ class HHIntegrationService:
     def _auth_headers(self, token: str) -> dict:
         return {"Authorization": f"Bearer {token}"}
 
+    @staticmethod
+    def _flow(token: str) -> str:
+        # Requests of one HH account share a fair-queuing flow; the token itself is not kept
+        return hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+
     def get_login_url(self) -> str:
         """
         Generates the URL for the frontend to redirect the user to.
@@ -102,9 +128,22 @@ class HHIntegrationService:
         Returns:
             List of resume dictionaries.
         """
-        data = await self.client.get("/resumes/mine", headers=self._auth_headers(token))
+        data = await self.client.get("/resumes/mine", headers=self._auth_headers(token), flow=self._flow(token))
         return data.get("items", [])
 
+    async def get_resume(self, token: str, resume_id: str) -> dict:
+        """
+        Fetch the full resume (skills, experience) by ID.
+
+        Args:
+            token: Valid access token.
+            resume_id: The HH resume ID.
+
+        Returns:
+            Resume dictionary.
+        """
+        return await self.client.get(f"/resumes/{resume_id}", headers=self._auth_headers(token), flow=self._flow(token))
+
     async def search_vacancies(
             self,
             token: str,
@@ -136,10 +175,79 @@ class HHIntegrationService:
         data = await self.client.get(
             "/vacancies",
             params=params,
-            headers=self._auth_headers(token)
+            headers=self._auth_headers(token),
+            flow=self._flow(token)
         )
         return HHSearchResultsDTO(**data)
 
+    async def iter_vacancy_pages(
+            self,
+            token: str,
+            text: str,
+            filters: dict[str, Any],
+            on_unauthorized: Optional[Callable[[str], Awaitable[str]]] = None,
+            cursor: Optional[HHSearchCursorDTO] = None,
+            lookahead: int = 1
+    ) -> AsyncIterator[tuple[HHSearchCursorDTO, HHSearchResultsDTO]]:
+        """
+        Lazily pages through all results of a search, past HH's result cap.
+
+        The search is split into partitions by SearchPlanner and fetched with
+        the maximum page size, prefetching up to lookahead pages.
+
+        Args:
+            token: Valid access token.
+            text: Search query string.
+            filters: Additional query parameters (area, salary, etc).
+            on_unauthorized: Called with the rejected token when a search is
+                rejected with 401, returns a fresh access token.
+            cursor: Position to continue from instead of planning the search.
+            lookahead: Number of pages fetched ahead of the consumer.
+
+        Yields:
+            The position of every page, to continue from, and the page itself.
+        """
+        planner = SearchPlanner(self, token, text, filters, on_unauthorized=on_unauthorized)
+        async with aclosing(planner.iter_pages(cursor, lookahead)) as pages:
+            async for position, results in pages:
+                yield position, results
+
+    async def iter_vacancies(
+            self,
+            token: str,
+            text: str,
+            filters: dict[str, Any],
+            on_unauthorized: Optional[Callable[[str], Awaitable[str]]] = None,
+            lookahead: int = 1
+    ) -> AsyncIterator[HHVacancyItemDTO]:
+        """
+        Lazily yields all vacancies of a search; see iter_vacancy_pages.
+        """
+        async with aclosing(self.iter_vacancy_pages(token, text, filters, on_unauthorized, lookahead=lookahead)) as pages:
+            async for _, results in pages:
+                for item in results.items:
+                    yield item
+
+    async def get_negotiations(self, token: str, page: int = 0, per_page: int = 100) -> HHNegotiationsPageDTO:
+        """
+        Fetch a page of the user's negotiations, most recently updated first.
+
+        Args:
+            token: Valid access token.
+            page: Page number (0-indexed).
+            per_page: Items per page.
+
+        Returns:
+            Negotiations page DTO.
+        """
+        data = await self.client.get(
+            "/negotiations",
+            params={"page": page, "per_page": per_page},
+            headers=self._auth_headers(token),
+            flow=self._flow(token)
+        )
+        return HHNegotiationsPageDTO(**data)
+
     async def apply_for_vacancy(
             self,
             token: str,
@@ -158,10 +266,29 @@ class HHIntegrationService:
         await self.client.post(
             "/negotiations",
             json_body=payload.model_dump(),
-            headers=self._auth_headers(token)
+            headers=self._auth_headers(token),
+            flow=self._flow(token)
         )
         return True
 
+    async def get_areas(self) -> list[dict]:
+        """
+        Fetches the tree of HH areas (GET /areas), no authorization needed.
+
+        Returns:
+            Top-level areas with their nested areas.
+        """
+        return await self.client.get("/areas")
+
+    async def get_dictionaries(self) -> dict:
+        """
+        Fetches HH dictionaries (GET /dictionaries), no authorization needed.
+
+        Returns:
+            Dictionary entries by dictionary name.
+        """
+        return await self.client.get("/dictionaries")
+
     async def get_user_info(self, token: str) -> dict:
         """
         Fetches the current user's information from HH (GET /me).
@@ -172,4 +299,4 @@ class HHIntegrationService:
         Returns:
             Dictionary containing user info (id, email, etc).
         """
-        return await self.client.get("/me", headers=self._auth_headers(token))
+        return await self.client.get("/me", headers=self._auth_headers(token), flow=self._flow(token))
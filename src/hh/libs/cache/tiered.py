@@ -0,0 +1,173 @@
+import itertools
+import logging
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from hh.libs.cache.ttl import TTLCache
+from hh.libs.redis.client import RedisHelper
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Generations must outlive any load that started before an invalidation
+GENERATION_TTL = 86_400
+
+# Writes the value only if the generation did not change since it was read
+_SET_IF_GENERATION_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Local generations are unique across keys, so an evicted one is never reissued
+_local_generations = itertools.count(1)
+
+Generation = tuple[int, str]
+
+
+class TieredCache(Generic[M]):
+    """
+    Read-through cache of pydantic models: an in-process TTL tier in front of
+    an optional shared Redis tier.
+
+    Deletes reach Redis immediately, but other processes keep their local copy
+    until local_ttl runs out, so local_ttl bounds cross-process staleness.
+    Redis failures are logged and treated as misses.
+
+    Every delete moves the key to a new generation. A loader reads the
+    generation before loading and passes it to set, which drops the value if
+    the key was invalidated meanwhile, so a slow loader cannot put back a
+    value older than the write that invalidated it.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        model: type[M],
+        ttl: float,
+        local_ttl: Optional[float] = None,
+        maxsize: int = 1024,
+        redis: Optional[RedisHelper] = None,
+    ):
+        """
+        Args:
+            namespace: Prefix of the Redis keys.
+            model: Pydantic model of the cached values.
+            ttl: Time to live in Redis, in seconds.
+            local_ttl: Time to live in process memory, defaults to ttl.
+            maxsize: Maximum number of entries in process memory.
+            redis: Redis helper, or None for an in-process only cache.
+        """
+        self.namespace = namespace
+        self.model = model
+        self.ttl = ttl
+        self.redis = redis
+        self._local: TTLCache[str, M] = TTLCache(
+            maxsize=maxsize, ttl=ttl if local_ttl is None else local_ttl
+        )
+        self._generations: TTLCache[str, int] = TTLCache(maxsize=maxsize, ttl=GENERATION_TTL)
+
+    def _key(self, key: object) -> str:
+        return f"{self.namespace}:{key}"
+
+    @staticmethod
+    def _generation_key(cache_key: str) -> str:
+        return f"{cache_key}:gen"
+
+    async def generation(self, key: object) -> Optional[Generation]:
+        """
+        Reads the generation of a key; call it before loading the value to cache.
+
+        Returns:
+            The generation to pass to set, or None if it cannot be read and
+            the loaded value must not be cached.
+        """
+        cache_key = self._key(key)
+        local = self._generations.get(cache_key) or 0
+        if self.redis is None:
+            return local, ""
+
+        try:
+            remote = await self.redis.client.get(self._generation_key(cache_key))
+        except RedisError as e:
+            logger.warning(f"Cache generation read failed for {cache_key}: {e}")
+            return None
+        return local, remote or ""
+
+    async def get(self, key: object) -> Optional[M]:
+        cache_key = self._key(key)
+        value = self._local.get(cache_key)
+        if value is not None or self.redis is None:
+            return value
+
+        try:
+            raw = await self.redis.client.get(cache_key)
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {cache_key}: {e}")
+            return None
+        if raw is None:
+            return None
+
+        value = self.model.model_validate_json(raw)
+        self._local.set(cache_key, value)
+        return value
+
+    async def set(
+        self,
+        key: object,
+        value: M,
+        ttl: Optional[float] = None,
+        generation: Optional[Generation] = None,
+    ) -> None:
+        """
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: Time to live in Redis, defaults to the cache's ttl.
+            generation: Generation read before the value was loaded; the value is
+                dropped if the key has been invalidated since.
+        """
+        cache_key = self._key(key)
+        ttl = self.ttl if ttl is None else ttl
+        if generation is not None and (self._generations.get(cache_key) or 0) != generation[0]:
+            return
+        if self.redis is None or ttl <= 0:
+            self._local.set(cache_key, value, min(ttl, self._local.ttl))
+            return
+
+        try:
+            if generation is None:
+                await self.redis.client.set(cache_key, value.model_dump_json(), ex=max(1, int(ttl)))
+            elif not await self.redis.client.eval(
+                _SET_IF_GENERATION_SCRIPT, 2,
+                cache_key, self._generation_key(cache_key),
+                generation[1], value.model_dump_json(), max(1, int(ttl)),
+            ):
+                return
+        except RedisError as e:
+            logger.warning(f"Cache write failed for {cache_key}: {e}")
+        self._local.set(cache_key, value, min(ttl, self._local.ttl))
+
+    async def delete(self, key: object) -> None:
+        """
+        Removes the value and moves the key to a new generation.
+        """
+        cache_key = self._key(key)
+        self._local.delete(cache_key)
+        self._generations.set(cache_key, next(_local_generations))
+        if self.redis is None:
+            return
+
+        try:
+            async with self.redis.client.pipeline(transaction=True) as pipe:
+                pipe.incr(self._generation_key(cache_key))
+                pipe.expire(self._generation_key(cache_key), GENERATION_TTL)
+                pipe.delete(cache_key)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Cache invalidation failed for {cache_key}: {e}")
@@ -17,4 +17,11 @@ class PaginationError(Exception):
     """
     Raised for invalid pagination parameters (e.g., negative limit).
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class Overloaded(Exception):
+    """
+    Raised when a bounded resource (e.g., a worker pool queue) is full.
+    """
+    pass
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Callable, TypeVar, ParamSpec
+
+from hh.libs.exceptions import Overloaded
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    # Seconds spent waiting for a free thread and running, summed over completed jobs
+    total_wait: float = 0.0
+    total_run: float = 0.0
+
+
+class BoundedExecutor:
+    """
+    Runs blocking functions in a dedicated, size-limited thread pool.
+
+    At most max_workers jobs run at once and at most max_queue more wait for a
+    thread; further submissions are rejected immediately with Overloaded instead
+    of piling up behind a saturated pool. A job leaves the bound when it leaves
+    the pool, not when its caller stops waiting: a cancelled caller's job keeps
+    its slot until it is cancelled in the queue or finishes running.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """
+        Args:
+            name: Name prefix of the pool threads.
+            max_workers: Number of threads.
+            max_queue: Number of jobs allowed to wait for a thread.
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.stats = ExecutorStats()
+        # Jobs finish in pool threads while the event loop submits new ones
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.stats.in_flight - self.max_workers)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the counters together with the current queue depth.
+        """
+        with self._lock:
+            return {**asdict(self.stats), "queue_depth": self.queue_depth}
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """
+        Runs func in the pool and waits for the result without blocking the event loop.
+
+        Raises:
+            Overloaded: If all threads are busy and the queue is full.
+        """
+        with self._lock:
+            if self.stats.in_flight >= self.max_workers + self.max_queue:
+                self.stats.rejected += 1
+                overloaded = True
+            else:
+                overloaded = False
+                self.stats.submitted += 1
+                self.stats.in_flight += 1
+                self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        if overloaded:
+            logger.warning(f"{self.name} executor rejected a job: {self.snapshot()}")
+            raise Overloaded(f"{self.name} executor queue is full")
+
+        submitted_at = time.monotonic()
+
+        def job() -> tuple[T, float]:
+            started_at = time.monotonic()
+            return func(*args, **kwargs), started_at
+
+        future = self._pool.submit(job)
+        future.add_done_callback(lambda done: self._finished(done, submitted_at))
+        # Cancelling the caller cancels a job still waiting for a thread; a running one is left to finish
+        result, _ = await asyncio.wrap_future(future)
+        return result
+
+    def _finished(self, future: Future, submitted_at: float) -> None:
+        finished_at = time.monotonic()
+        with self._lock:
+            self.stats.in_flight -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self.stats.failed += 1
+                return
+            _, started_at = future.result()
+            self.stats.completed += 1
+            self.stats.total_wait += started_at - submitted_at
+            self.stats.total_run += finished_at - started_at
+
+    def shutdown(self, wait: bool = True) -> None:
+        logger.info(f"{self.name} executor stats: {self.snapshot()}")
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
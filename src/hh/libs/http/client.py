@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import Any, Hashable
 from urllib.parse import urljoin
 
 import httpx
@@ -16,7 +16,7 @@ from hh.libs.http.exceptions import (
     RateLimitExceeded,
     UnauthorizedError,
 )
-from hh.libs.http.throttler import AsyncThrottler
+from hh.libs.http.throttler import AsyncThrottler, FairThrottler, RedisFairThrottler
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +46,7 @@ class AsyncHttpClient:
     def __init__(
         self,
         base_url: str = "",
-        throttler: AsyncThrottler | None = None,
+        throttler: AsyncThrottler | FairThrottler | RedisFairThrottler | None = None,
         headers: dict | None = None,
     ):
         """
@@ -54,11 +54,12 @@ class AsyncHttpClient:
 
         Args:
             base_url: The base URL to be prepended to all requests.
-            throttler: An optional AsyncThrottler instance for rate limiting.
+            throttler: An optional throttler for rate limiting. Defaults to the
+                FairThrottler shared by all clients of the running event loop.
             headers: Optional dictionary of headers to merge with defaults.
         """
         self.base_url = base_url
-        self.throttler = throttler or AsyncThrottler()
+        self.throttler = throttler
         self._headers = {**self.DEFAULT_HEADERS, **(headers or {})}
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
@@ -92,6 +93,8 @@ class AsyncHttpClient:
         params: dict | None = None,
         json_body: dict | None = None,
         headers: dict | None = None,
+        data: dict | None = None,
+        flow: Hashable | None = None,
     ) -> Any:
         """
         Performs an asynchronous HTTP request with throttling and error handling.
@@ -102,6 +105,9 @@ class AsyncHttpClient:
             params: Optional dictionary of query parameters.
             json_body: Optional dictionary to be sent as the JSON request body.
             headers: Optional dictionary of headers to override client defaults.
+            data: Optional dictionary to be sent as a form-encoded body.
+            flow: Fairness unit of the request (e.g. the caller's account) for
+                the fair throttler.
 
         Returns:
             The JSON response from the server, typically a dict or list.
@@ -112,7 +118,8 @@ class AsyncHttpClient:
             HttpStatusCodeError: On any other 4xx or 5xx status code.
             NetworkError: On connection errors or other httpx request issues.
         """
-        await self.throttler.acquire(self.base_url or "default")
+        throttler = self.throttler or FairThrottler.for_running_loop()
+        await throttler.acquire(self.base_url or "default", flow=flow)
 
         try:
             response = await self._client.request(
@@ -120,6 +127,7 @@ class AsyncHttpClient:
                 url=url,
                 params=params,
                 json=json_body,
+                data=data,
                 headers=headers,
             )
 
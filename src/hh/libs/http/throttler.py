@@ -1,7 +1,17 @@
 import asyncio
+import logging
 import time
+import uuid
+import weakref
 from collections import deque
 from dataclasses import dataclass, field
+from typing import Hashable
+
+from redis.exceptions import RedisError
+
+from hh.libs.redis.client import RedisHelper
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -30,7 +40,8 @@ class AsyncThrottler:
             self._buckets[key] = HostBucket()
         return self._buckets[key]
 
-    async def acquire(self, key: str):
+    async def acquire(self, key: str, flow: Hashable | None = None):
+        # Waiters are served in arrival order, flows are not distinguished
         bucket = self._get_bucket(key)
 
         async with bucket.lock:
@@ -45,4 +56,264 @@ class AsyncThrottler:
                 if wait_time > 0:
                     await asyncio.sleep(wait_time)
 
-            bucket.timestamps.append(time.monotonic())
\ No newline at end of file
+            bucket.timestamps.append(time.monotonic())
+
+@dataclass
+class _Flow:
+    deficit: float = 0.0
+    waiters: deque = field(default_factory=deque)
+
+
+@dataclass
+class _FairQueue:
+    flows: dict[Hashable, _Flow] = field(default_factory=dict)
+    active: deque = field(default_factory=deque)
+    dispatcher: asyncio.Task | None = None
+
+
+class FairThrottler:
+    """
+    Weighted fair queuing of requests in front of an AsyncThrottler.
+
+    Requests of every flow (e.g. one user's HH token) wait in their own FIFO,
+    and the rate slots of the underlying throttler are handed out to the flows
+    by deficit round-robin: each round a flow may send quantum * weight
+    requests. A flow with a long backlog therefore delays every other flow by
+    at most one round instead of its whole backlog.
+
+    The dispatcher is a task of the event loop that created it, so an instance
+    must not be shared between loops; use for_running_loop. Flows are only
+    balanced within one loop: a Celery task runs its own loop for a single
+    user, so use RedisFairThrottler where processes compete for a rate.
+    """
+    _per_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FairThrottler]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, throttler: AsyncThrottler | None = None, quantum: float = 1.0):
+        """
+        Args:
+            throttler: Global rate limit per key, shared by all flows.
+            quantum: Requests per round of a flow with weight 1.
+        """
+        self.throttler = throttler or AsyncThrottler()
+        self.quantum = quantum
+        self._weights: dict[Hashable, float] = {}
+        self._queues: dict[str, _FairQueue] = {}
+
+    @classmethod
+    def for_running_loop(cls) -> "FairThrottler":
+        """
+        Returns the throttler shared by all clients of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        throttler = cls._per_loop.get(loop)
+        if throttler is None:
+            throttler = cls._per_loop[loop] = cls()
+        return throttler
+
+    def set_weight(self, flow: Hashable, weight: float) -> None:
+        """
+        Sets the share of a flow relative to others, e.g. by plan tier. Default 1.
+        """
+        self._weights[flow] = weight
+
+    async def acquire(self, key: str, flow: Hashable | None = None):
+        """
+        Waits for the flow's turn and a rate slot for the key.
+
+        Args:
+            key: Rate limit key, e.g. the host.
+            flow: Fairness unit; requests without a flow share one.
+        """
+        queue = self._queues.setdefault(key, _FairQueue())
+        if flow not in queue.flows:
+            queue.flows[flow] = _Flow()
+            queue.active.append(flow)
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.flows[flow].waiters.append(waiter)
+        if queue.dispatcher is None or queue.dispatcher.done():
+            queue.dispatcher = asyncio.create_task(self._dispatch(key, queue))
+
+        await waiter
+
+    async def _dispatch(self, key: str, queue: _FairQueue):
+        while queue.active:
+            flow_key = queue.active[0]
+            flow = queue.flows[flow_key]
+            flow.deficit += self.quantum * self._weights.get(flow_key, 1.0)
+
+            while flow.waiters and flow.deficit >= 1:
+                waiter = flow.waiters.popleft()
+                if waiter.done():
+                    # Cancelled while waiting
+                    continue
+                await self.throttler.acquire(key)
+                if not waiter.done():
+                    waiter.set_result(None)
+                flow.deficit -= 1
+
+            queue.active.popleft()
+            if flow.waiters:
+                queue.active.append(flow_key)
+            else:
+                # Idle flows don't bank credit
+                del queue.flows[flow_key]
+
+
+# Token bucket refilled at ARGV[1] tokens per second up to ARGV[2] tokens.
+# Returns 0 if a token was taken, otherwise milliseconds until one is available.
+_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local rate, burst = tonumber(ARGV[1]), tonumber(ARGV[2])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = math.min(burst, (tonumber(bucket[1]) or burst) + (now - (tonumber(bucket[2]) or now)) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return wait
+"""
+
+# Start-time fair queuing over a shared token bucket.
+# KEYS: waiters zset (by virtual tag), waiter leases hash, last tag per flow hash,
+#       bucket hash, virtual clock.
+# ARGV: waiter, flow, weight, rate, burst, lease seconds.
+# A waiter is tagged once with max(virtual clock, last tag of its flow) + 1 / weight,
+# and granted when it has the lowest tag and a token is available.
+# Returns 0 when granted, otherwise milliseconds to wait before asking again.
+_FAIR_QUEUE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local waiter, flow = ARGV[1], ARGV[2]
+local rate, burst = tonumber(ARGV[4]), tonumber(ARGV[5])
+
+local tag = tonumber(redis.call('ZSCORE', KEYS[1], waiter))
+if not tag then
+    local clock = tonumber(redis.call('GET', KEYS[5])) or 0
+    local last = tonumber(redis.call('HGET', KEYS[3], flow)) or 0
+    tag = math.max(clock, last) + 1 / tonumber(ARGV[3])
+    redis.call('HSET', KEYS[3], flow, tag)
+    redis.call('ZADD', KEYS[1], tag, waiter)
+end
+redis.call('HSET', KEYS[2], waiter, now + tonumber(ARGV[6]))
+for i = 1, 5 do
+    redis.call('EXPIRE', KEYS[i], 86400)
+end
+
+-- Waiters of dead processes stop renewing their lease and are dropped
+while true do
+    local head = redis.call('ZRANGE', KEYS[1], 0, 0)[1]
+    if head == waiter then
+        break
+    end
+    local lease = tonumber(redis.call('HGET', KEYS[2], head))
+    if lease and lease >= now then
+        return math.ceil(redis.call('ZRANK', KEYS[1], waiter) / rate * 1000)
+    end
+    redis.call('ZREM', KEYS[1], head)
+    redis.call('HDEL', KEYS[2], head)
+end
+
+local bucket = redis.call('HMGET', KEYS[4], 'tokens', 'ts')
+local tokens = math.min(burst, (tonumber(bucket[1]) or burst) + (now - (tonumber(bucket[2]) or now)) * rate)
+if tokens < 1 then
+    redis.call('HSET', KEYS[4], 'tokens', tokens, 'ts', now)
+    return math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[4], 'tokens', tokens - 1, 'ts', now)
+redis.call('ZREM', KEYS[1], waiter)
+redis.call('HDEL', KEYS[2], waiter)
+redis.call('SET', KEYS[5], tag, 'EX', 86400)
+-- A flow without queued requests must not keep its tag
+if tonumber(redis.call('HGET', KEYS[3], flow)) == tag then
+    redis.call('HDEL', KEYS[3], flow)
+end
+return 0
+"""
+
+
+class RedisFairThrottler:
+    """
+    Rate limits and fair queuing shared by every process through Redis.
+
+    Each flow (e.g. one HH account) is limited to flow_rate requests per second
+    on its own. Requests that passed their flow's limit then queue for the
+    global rate of the key and are granted in start-time fair queuing order:
+    a backlogged flow gets a share of the global rate proportional to its
+    weight, however many requests it has queued and in whichever process.
+
+    Waiters poll Redis with the wait the scripts return and renew a lease on
+    every poll, so waiters of a killed process are dropped after the lease.
+    If Redis fails, requests fall back to the FairThrottler of the running loop.
+    """
+    LEASE = 5.0
+    MAX_POLL_INTERVAL = 1.0
+
+    def __init__(self, redis: RedisHelper, namespace: str, rate: float, flow_rate: float):
+        """
+        Args:
+            redis: Redis helper shared by the processes.
+            namespace: Prefix of the Redis keys.
+            rate: Requests per second per key, shared by all flows.
+            flow_rate: Requests per second per key of a single flow.
+        """
+        self.redis = redis
+        self.namespace = namespace
+        self.rate = rate
+        self.flow_rate = flow_rate
+        self._weights: dict[Hashable, float] = {}
+
+    def set_weight(self, flow: Hashable, weight: float) -> None:
+        """
+        Sets the share of a flow relative to others, e.g. by plan tier. Default 1.
+        Weights are per process and sent with every request of the flow.
+        """
+        self._weights[flow] = weight
+
+    async def acquire(self, key: str, flow: Hashable | None = None):
+        """
+        Waits for a slot of the flow and then for the flow's turn in the key's queue.
+
+        Args:
+            key: Rate limit key, e.g. the host.
+            flow: Fairness unit; requests without a flow share one.
+        """
+        try:
+            await self._acquire(key, flow)
+        except RedisError as e:
+            logger.warning(f"Shared throttling unavailable, throttling locally: {e}")
+            await FairThrottler.for_running_loop().acquire(key, flow)
+
+    async def _acquire(self, key: str, flow: Hashable | None):
+        client = self.redis.client
+        flow_name = "" if flow is None else str(flow)
+        prefix = f"{self.namespace}:{key}"
+
+        while wait := await client.eval(
+            _BUCKET_SCRIPT, 1, f"{prefix}:flow:{flow_name}", self.flow_rate, self.flow_rate
+        ):
+            await asyncio.sleep(wait / 1000)
+
+        waiter = uuid.uuid4().hex
+        keys = (f"{prefix}:waiters", f"{prefix}:leases", f"{prefix}:tags", f"{prefix}:bucket", f"{prefix}:clock")
+        granted = False
+        try:
+            while wait := await client.eval(
+                _FAIR_QUEUE_SCRIPT, len(keys), *keys,
+                waiter, flow_name, self._weights.get(flow, 1.0), self.rate, self.rate, self.LEASE
+            ):
+                await asyncio.sleep(min(wait / 1000, self.MAX_POLL_INTERVAL))
+            granted = True
+        finally:
+            if not granted:
+                # Cancelled or failed while queued: leave the queue right away
+                try:
+                    await client.zrem(keys[0], waiter)
+                    await client.hdel(keys[1], waiter)
+                except RedisError:
+                    pass
@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from hh.libs.exceptions import PaginationError
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Packs the sort key of the last returned row into an opaque cursor.
+
+    Args:
+        *values: JSON-serializable key values (datetimes are sent as ISO strings).
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Unpacks a cursor produced by encode_cursor.
+
+    Args:
+        cursor: The cursor string.
+        size: Expected number of key values.
+
+    Returns:
+        The key values.
+
+    Raises:
+        PaginationError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise PaginationError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise PaginationError("Invalid cursor")
+    return values
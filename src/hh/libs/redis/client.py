@@ -0,0 +1,31 @@
+from redis.asyncio import Redis
+
+from hh.config.redis import settings
+
+
+class RedisHelper:
+    """ Class helper for work with redis connection """
+    def __init__(self, url: str):
+        self.url = url
+        self._client: Redis | None = None
+
+    @property
+    def client(self) -> Redis:
+        """
+        Lazily created client; connections belong to the event loop that opened them.
+        """
+        if self._client is None:
+            self._client = Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    async def close(self):
+        """
+        Closes the client and its pool. Must be called before the event loop
+        finishes (e.g. at the end of every asyncio.run in Celery tasks).
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+redis_helper = RedisHelper(settings.redis_url())
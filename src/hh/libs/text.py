@@ -0,0 +1,27 @@
+import re
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_text(text: str | None) -> str:
+    """
+    Lowercases text and strips HTML tags (HH highlights matches with <highlighttext>).
+    """
+    if not text:
+        return ""
+    return _TAG_RE.sub(" ", text).lower()
+
+
+def tokenize(text: str | None, min_length: int = 2) -> list[str]:
+    """
+    Splits normalized text into word tokens, dropping very short ones.
+
+    Args:
+        text: Raw text, may contain HTML.
+        min_length: Minimum token length to keep.
+
+    Returns:
+        List of lowercase tokens in document order.
+    """
+    return [token for token in _WORD_RE.findall(normalize_text(text)) if len(token) >= min_length]
@@ -1,10 +1,25 @@
 from fastapi import FastAPI
 
+from hh.auth.service.password import password_executor
+from hh.config.celery import celery_app
+from hh.integration.hh.dependencies.service import close_hh_service
+from hh.libs.redis.client import redis_helper
+from hh.vacancy.dictionaries import hh_dictionaries
+from hh.vacancy.progress import progress_hub
+
 
 async def lifespan(app: FastAPI):
 
     #Before app startup
+    if hh_dictionaries.get() is None:
+        # First start: settings are not validated until the snapshot is written
+        # Sent by name: importing the task would load the worker modules into the API
+        celery_app.send_task("hh.worker.tasks.refresh_hh_dictionaries")
 
     yield
 
-    #After app startup
\ No newline at end of file
+    #After app startup
+    await close_hh_service()
+    await progress_hub.close()
+    await redis_helper.close()
+    password_executor.shutdown(wait=False)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 
-from hh.user.user_router import router as user_router
+from hh.auth.user_router import router as user_router
 from hh.auth.router import router as auth_router
 from hh.vacancy.router import router as vacancy_router
+from hh.vacancy.ws_router import router as vacancy_ws_router
 
 router = APIRouter(prefix="/api")
 
@@ -10,4 +11,6 @@ router.include_router(user_router)
 router.include_router(auth_router)
 router.include_router(vacancy_router)
 
-websocket_router = APIRouter()
\ No newline at end of file
+websocket_router = APIRouter()
+
+websocket_router.include_router(vacancy_ws_router)
\ No newline at end of file
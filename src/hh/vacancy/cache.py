@@ -0,0 +1,27 @@
+from hh.config.cache import settings as cache_settings
+from hh.libs.cache.tiered import TieredCache
+from hh.libs.redis.client import redis_helper
+from hh.vacancy.dto import SearchSettingsDTO, HHProfileDTO
+
+_redis = redis_helper if cache_settings.vacancy_cache_redis else None
+
+# Both caches are keyed by the internal user ID, filled on reads and invalidated on writes by VacancyRepository.
+# HH tokens are not part of HHProfileDTO: they would sit in plaintext in the broker's Redis and in the
+# local tier of every process, which keeps serving a rotated-out refresh token for local_ttl.
+settings_cache: TieredCache[SearchSettingsDTO] = TieredCache(
+    namespace="vacancy:settings",
+    model=SearchSettingsDTO,
+    ttl=cache_settings.vacancy_cache_ttl,
+    local_ttl=cache_settings.vacancy_cache_local_ttl,
+    maxsize=cache_settings.vacancy_cache_size,
+    redis=_redis,
+)
+
+profile_cache: TieredCache[HHProfileDTO] = TieredCache(
+    namespace="vacancy:hh_profile",
+    model=HHProfileDTO,
+    ttl=cache_settings.vacancy_cache_ttl,
+    local_ttl=cache_settings.vacancy_cache_local_ttl,
+    maxsize=cache_settings.vacancy_cache_size,
+    redis=_redis,
+)
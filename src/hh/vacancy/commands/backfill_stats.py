@@ -0,0 +1,82 @@
+"""
+Rebuilds the application_daily_stats rollup from the applications table.
+
+Users are processed in id order, chunk by chunk; each chunk is replaced in
+its own transaction so the command can be interrupted and resumed with
+--after-user-id. 'error' counts are not stored in applications and are lost
+for rebuilt users. Run it while the workers are stopped, or accept that
+applications written to a chunk during its rebuild may be counted twice.
+
+Usage:
+
+    python -m hh.vacancy.commands.backfill_stats --chunk-size 500
+"""
+import argparse
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy import select, delete, insert, func
+
+from hh.auth.models.user import UserModel
+from hh.config.database.engine import db_helper
+from hh.config.project import settings as project_settings
+from hh.vacancy.models import ApplicationModel, ApplicationStatsModel
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill(chunk_size: int, after_user_id: int = 0) -> None:
+    """
+    Rebuilds the rollup of all users with an id greater than after_user_id.
+
+    Args:
+        chunk_size: Number of users per transaction.
+        after_user_id: Last user id already processed.
+    """
+    # Same day boundaries as VacancyRepository.stats_day
+    day = func.date(
+        func.timezone("UTC", ApplicationModel.created_at)
+        + timedelta(hours=project_settings.timezone_shift)
+    )
+
+    async with db_helper.session_factory() as session:
+        while True:
+            result = await session.execute(
+                select(UserModel.id)
+                .where(UserModel.id > after_user_id)
+                .order_by(UserModel.id)
+                .limit(chunk_size)
+            )
+            user_ids = list(result.scalars().all())
+            if not user_ids:
+                break
+
+            await session.execute(
+                delete(ApplicationStatsModel).where(ApplicationStatsModel.user_id.in_(user_ids))
+            )
+            rollup = (
+                select(ApplicationModel.user_id, day, ApplicationModel.status, func.count())
+                .where(ApplicationModel.user_id.in_(user_ids))
+                .group_by(ApplicationModel.user_id, day, ApplicationModel.status)
+            )
+            await session.execute(
+                insert(ApplicationStatsModel).from_select(
+                    ["user_id", "day", "status", "count"], rollup
+                )
+            )
+            await session.commit()
+
+            after_user_id = user_ids[-1]
+            logger.info(f"Rebuilt application stats up to user {after_user_id}")
+
+    await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--after-user-id", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(backfill(args.chunk_size, args.after_user_id))
@@ -0,0 +1,100 @@
+from string import Formatter
+from typing import Callable, Optional, Any
+
+from hh.integration.hh.dto import HHVacancyItemDTO
+
+
+class CoverLetterTemplateError(ValueError):
+    """
+    Raised when a cover letter template cannot be compiled.
+    """
+    pass
+
+
+def _format_salary(salary: Optional[dict[str, Any]]) -> str:
+    if not salary:
+        return ""
+    low, high, currency = salary.get("from"), salary.get("to"), salary.get("currency") or ""
+    if low and high:
+        amount = f"{low}-{high}"
+    elif low:
+        amount = f"from {low}"
+    elif high:
+        amount = f"up to {high}"
+    else:
+        return ""
+    return f"{amount} {currency}".strip()
+
+
+PLACEHOLDERS: dict[str, Callable[[HHVacancyItemDTO], str]] = {
+    "vacancy_name": lambda item: item.name,
+    "vacancy_url": lambda item: item.alternate_url,
+    "employer_name": lambda item: item.employer.get("name") or "",
+    "salary": lambda item: _format_salary(item.salary),
+}
+
+
+class CoverLetterTemplate:
+    """
+    Cover letter with {placeholder} substitution, compiled once and rendered per vacancy.
+
+    Placeholders: {vacancy_name}, {vacancy_url}, {employer_name}, {salary}.
+    Literal braces are written as {{ and }}.
+    """
+
+    def __init__(self, source: str):
+        """
+        Compiles the template.
+
+        Args:
+            source: Template text.
+
+        Raises:
+            CoverLetterTemplateError: On syntax errors or unknown placeholders.
+        """
+        self.source = source
+        self._parts: tuple[str | Callable[[HHVacancyItemDTO], str], ...] = self._compile(source)
+
+    @classmethod
+    def literal(cls, text: str) -> "CoverLetterTemplate":
+        """
+        Builds a template that renders the text as is, braces included.
+        """
+        template = cls("")
+        template.source = text
+        template._parts = (text,) if text else ()
+        return template
+
+    @staticmethod
+    def _compile(source: str) -> tuple[str | Callable[[HHVacancyItemDTO], str], ...]:
+        parts: list[str | Callable[[HHVacancyItemDTO], str]] = []
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise CoverLetterTemplateError(f"Invalid cover letter template: {e}") from e
+
+        for literal_text, field_name, format_spec, conversion in parsed:
+            if literal_text:
+                if parts and isinstance(parts[-1], str):
+                    parts[-1] += literal_text
+                else:
+                    parts.append(literal_text)
+            if field_name is None:
+                continue
+            if field_name not in PLACEHOLDERS:
+                allowed = ", ".join(f"{{{name}}}" for name in PLACEHOLDERS)
+                raise CoverLetterTemplateError(
+                    f"Unknown placeholder {{{field_name}}} in cover letter, allowed: {allowed}"
+                )
+            if format_spec or conversion:
+                raise CoverLetterTemplateError(
+                    f"Format specifiers are not supported in placeholder {{{field_name}}}"
+                )
+            parts.append(PLACEHOLDERS[field_name])
+        return tuple(parts)
+
+    def render(self, item: HHVacancyItemDTO) -> str:
+        """
+        Renders the letter for a vacancy.
+        """
+        return "".join(part if isinstance(part, str) else part(item) for part in self._parts)
@@ -2,8 +2,9 @@ from typing import Annotated
 from fastapi import Depends
 from hh.vacancy.service import VacancyService
 from hh.vacancy.dependencies.repository import IVacancyRepository
+from hh.integration.hh.dependencies.service import IHHService
 
-def get_vacancy_service(repo: IVacancyRepository) -> VacancyService:
-    return VacancyService(repo)
+def get_vacancy_service(repo: IVacancyRepository, hh_service: IHHService) -> VacancyService:
+    return VacancyService(repo, hh_service)
 
 IVacancyService: type[VacancyService] = Annotated[VacancyService, Depends(get_vacancy_service)]
\ No newline at end of file
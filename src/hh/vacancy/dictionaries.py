@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from hh.config.headhunter import settings as hh_settings
+from hh.vacancy.dto import AreaSuggestionDTO
+
+logger = logging.getLogger(__name__)
+
+# Search settings fields checked against HH dictionaries, by dictionary name
+CHECKED_FIELDS = {
+    "currency": "currency",
+    "schedule": "schedule",
+    "employment": "employment",
+    "order_by": "vacancy_search_order",
+}
+# Seconds between checks of the snapshot file for a newer version
+RELOAD_CHECK_INTERVAL = 60
+
+_WORD_START = re.compile(r"(?<=[\s\-(])\w")
+
+
+class AreaTrie:
+    """
+    Case-insensitive prefix index of area names.
+
+    Every word of a name is indexed, so "петер" finds "Санкт-Петербург".
+    """
+    _IDS = ""
+
+    def __init__(self):
+        self._root: dict = {}
+
+    def insert(self, name: str, area_id: str) -> None:
+        name = name.lower()
+        starts = [0] + [match.start() for match in _WORD_START.finditer(name)]
+        for start in starts:
+            node = self._root
+            for char in name[start:]:
+                node = node.setdefault(char, {})
+            node.setdefault(self._IDS, []).append(area_id)
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        """
+        Returns IDs of areas with a word starting with prefix, shortest completions first.
+
+        Args:
+            prefix: Beginning of a word of the area name.
+            limit: Maximum number of IDs to return.
+        """
+        node = self._root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return []
+
+        found: dict[str, None] = {}
+        queue = deque([node])
+        while queue and len(found) < limit:
+            node = queue.popleft()
+            for key, child in node.items():
+                if key == self._IDS:
+                    found.update(dict.fromkeys(child))
+                else:
+                    queue.append(child)
+        return list(found)[:limit]
+
+
+class HHDictionaries:
+    """
+    HH areas and dictionaries of a snapshot, indexed for lookups.
+    """
+
+    def __init__(self, snapshot: dict[str, Any]):
+        """
+        Args:
+            snapshot: Data of the snapshot file, see build_snapshot.
+        """
+        self.fetched_at: str = snapshot["fetched_at"]
+        self.areas: dict[str, tuple[str, Optional[str]]] = {
+            area_id: (name, parent_id) for area_id, parent_id, name in snapshot["areas"]
+        }
+        self.values: dict[str, frozenset[str]] = {
+            name: frozenset(ids) for name, ids in snapshot["dictionaries"].items()
+        }
+        self.trie = AreaTrie()
+        for area_id, (name, _) in self.areas.items():
+            self.trie.insert(name, area_id)
+
+    def check(self, area_id: Optional[str] = None, **fields: Optional[str]) -> list[str]:
+        """
+        Checks search parameters against the snapshot.
+
+        Args:
+            area_id: HH area ID.
+            **fields: Settings fields listed in CHECKED_FIELDS; other fields are ignored.
+
+        Returns:
+            Descriptions of the invalid values, empty if all are valid.
+        """
+        errors = []
+        if area_id is not None and area_id not in self.areas:
+            errors.append(f"Unknown area_id: {area_id}")
+        for field, value in fields.items():
+            dictionary = self.values.get(CHECKED_FIELDS.get(field, ""))
+            if value is not None and dictionary is not None and value not in dictionary:
+                errors.append(f"Unknown {field}: {value}")
+        return errors
+
+    def suggest_areas(self, prefix: str, limit: int = 10) -> list[AreaSuggestionDTO]:
+        """
+        Areas with a word of the name starting with prefix.
+
+        Args:
+            prefix: Text typed by the user.
+            limit: Maximum number of suggestions.
+        """
+        suggestions = []
+        for area_id in self.trie.search(prefix.strip(), limit):
+            name, parent_id = self.areas[area_id]
+            parent = self.areas.get(parent_id) if parent_id else None
+            suggestions.append(AreaSuggestionDTO(id=area_id, name=name, parent_name=parent[0] if parent else None))
+        return suggestions
+
+
+def build_snapshot(areas: list[dict], dictionaries: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduces the HH /areas tree and /dictionaries to the data needed locally.
+
+    Areas become flat [id, parent_id, name] rows, dictionaries keep only the
+    IDs (codes for currencies) of their entries.
+
+    Args:
+        areas: Response of GET /areas.
+        dictionaries: Response of GET /dictionaries.
+    """
+    rows = []
+    stack = list(areas)
+    while stack:
+        area = stack.pop()
+        rows.append([area["id"], area.get("parent_id"), area["name"]])
+        stack.extend(area.get("areas") or ())
+
+    values = {}
+    for name, entries in dictionaries.items():
+        if isinstance(entries, list) and entries and isinstance(entries[0], dict):
+            values[name] = [entry.get("id") or entry.get("code") for entry in entries]
+
+    return {
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "areas": rows,
+        "dictionaries": values,
+    }
+
+
+def write_snapshot(path: str, snapshot: dict[str, Any]) -> None:
+    """
+    Replaces the snapshot file atomically, readers see the old or the new file.
+
+    Every writer uses its own temporary file, so concurrent refreshes cannot
+    interleave their writes; the last replace wins.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        # mkstemp creates the file readable by the owner only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class DictionaryStore:
+    """
+    Process-wide HH dictionaries, reloaded when the snapshot file is replaced.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Location of the snapshot file written by the refresh task.
+        """
+        self.path = path
+        self._dictionaries: Optional[HHDictionaries] = None
+        self._mtime: Optional[int] = None
+        self._checked_at = float("-inf")
+
+    def get(self) -> Optional[HHDictionaries]:
+        """
+        Returns the loaded dictionaries, or None until a snapshot exists.
+        """
+        now = time.monotonic()
+        if now - self._checked_at >= RELOAD_CHECK_INTERVAL:
+            self._checked_at = now
+            self._reload()
+        return self._dictionaries
+
+    def _reload(self) -> None:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return
+            with open(self.path, "rb") as f:
+                self._dictionaries = HHDictionaries(json.loads(f.read()))
+            self._mtime = mtime
+            logger.info(f"Loaded HH dictionaries fetched at {self._dictionaries.fetched_at}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load HH dictionaries from {self.path}: {e}")
+
+
+hh_dictionaries = DictionaryStore(hh_settings.dictionaries_path)
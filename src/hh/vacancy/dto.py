@@ -1,7 +1,12 @@
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, Literal, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from hh.vacancy.cover_letter import CoverLetterTemplate
 
 class SearchSettingsDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     resume_id: str
     search_text: str
     area_id: str = "113"
@@ -12,11 +17,137 @@ class SearchSettingsDTO(BaseModel):
     employment: Optional[str] = None
     order_by: str = "publication_time"
     cover_letter: Optional[str] = None
+    excluded_employer_ids: List[str] = Field(default_factory=list)
+    excluded_title_keywords: List[str] = Field(default_factory=list)
+    min_relevance: Optional[float] = Field(default=None, ge=0, le=1)
 
 class SearchSettingsUpdateDTO(SearchSettingsDTO):
-    pass
+
+    @field_validator("cover_letter")
+    @classmethod
+    def validate_cover_letter(cls, value: Optional[str]) -> Optional[str]:
+        if value:
+            # Raises CoverLetterTemplateError (a ValueError) on broken templates
+            CoverLetterTemplate(value)
+        return value
+
+class SavedSearchCreateDTO(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+    search_text: str = Field(min_length=1)
+    area_id: str = "113"
+    salary: Optional[int] = None
+    schedule: Optional[str] = None
+    employment: Optional[str] = None
+    is_active: bool = True
+
+class SavedSearchDTO(SavedSearchCreateDTO):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+class AreaSuggestionDTO(BaseModel):
+    id: str
+    name: str
+    parent_name: Optional[str] = None
+
+class HHProfileDTO(BaseModel):
+    """The user's HH profile, without the OAuth tokens."""
+    model_config = ConfigDict(from_attributes=True)
+
+    user_id: int
+    hh_id: int
+    is_bot_active: bool = False
+    run_interval: Optional[int] = None
+    next_run_at: Optional[datetime] = None
+    negotiations_synced_at: Optional[datetime] = None
+
+class HHCredentialsDTO(BaseModel):
+    """The user's HH OAuth tokens; never cached, always read from the database."""
+    model_config = ConfigDict(from_attributes=True)
+
+    access_token: str
+    refresh_token: str
 
 class ApplicationLogDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    vacancy_id: str
+    status: str
+    created_at: datetime
+
+class VacancyDTO(BaseModel):
+    """Vacancy metadata as stored in the shared vacancies table."""
+    id: str
+    employer_id: Optional[str] = None
+    title: str
+    salary_from: Optional[int] = None
+    salary_to: Optional[int] = None
+    salary_currency: Optional[str] = None
+    published_at: Optional[datetime] = None
+    archived: bool = False
+
+    @classmethod
+    def from_hh(cls, data: dict) -> "VacancyDTO":
+        """
+        Builds the record from a vacancy of an HH search or negotiations response.
+
+        Args:
+            data: The vacancy as returned by HH.
+        """
+        employer = data.get("employer") or {}
+        salary = data.get("salary") or {}
+        return cls(
+            id=str(data["id"]),
+            employer_id=str(employer["id"]) if employer.get("id") else None,
+            title=data.get("name") or "",
+            salary_from=salary.get("from"),
+            salary_to=salary.get("to"),
+            salary_currency=salary.get("currency"),
+            published_at=data.get("published_at"),
+            archived=bool(data.get("archived")),
+        )
+
+class ApplicationRecordDTO(BaseModel):
+    """An application outcome waiting to be written in the next batch."""
     vacancy_id: str
     status: str
-    created_at: str
\ No newline at end of file
+    signature: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+class ApplicationPageDTO(BaseModel):
+    items: List[ApplicationLogDTO]
+    next_cursor: Optional[str] = None
+
+class ApplicationFilterDTO(BaseModel):
+    status: Optional[str] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+class ApplicationStatsDTO(BaseModel):
+    today: Dict[str, int]
+    week: Dict[str, int]
+
+class CachedResumesDTO(BaseModel):
+    fetched_at: datetime
+    items: List[dict]
+
+class RunProgressDTO(BaseModel):
+    state: Literal["running", "finished"] = "running"
+    page: int = 0
+    applied: int = 0
+    skipped: int = 0
+    errors: int = 0
+    quota_remaining: Optional[int] = None
+    next_run_at: Optional[datetime] = None
+
+class BotStatusDTO(BaseModel):
+    state: Literal["queued", "continuing", "running", "idle"] = "idle"
+    page: int = 0
+    applied: int = 0
+    skipped: int = 0
+    errors: int = 0
+    quota_remaining: Optional[int] = None
+    queued_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
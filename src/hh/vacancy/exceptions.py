@@ -0,0 +1,16 @@
+from hh.libs.exceptions import NotFound
+
+#Search settings
+class InvalidSearchSettings(Exception):
+    pass
+
+#Saved searches
+class SavedSearchNotFound(NotFound):
+    pass
+
+class SavedSearchLimitReached(Exception):
+    pass
+
+#Bot status
+class BotStatusUnavailable(Exception):
+    pass
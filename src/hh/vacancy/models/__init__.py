@@ -1,3 +1,7 @@
 from .search_settings import SearchSettingsModel
 from .application import ApplicationModel
-from .user_hh_profile import UserHHProfileModel
\ No newline at end of file
+from .application_stats import ApplicationStatsModel
+from .user_hh_profile import UserHHProfileModel
+from .vacancy_failure import VacancyFailureModel
+from .saved_search import SavedSearchModel
+from .vacancy import VacancyModel
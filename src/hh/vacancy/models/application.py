@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from typing import Optional
+
+from sqlalchemy import BigInteger, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from hh.libs.base_model import Base
@@ -9,9 +11,13 @@ class ApplicationModel(Base):
     __tablename__ = "applications"
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
-    vacancy_id: Mapped[str] = mapped_column(String, index=True)
+    vacancy_id: Mapped[str] = mapped_column(ForeignKey("vacancies.id"), index=True)
     status: Mapped[str] = mapped_column(String)
+    # SimHash of employer + title + snippet, for near-duplicate detection
+    signature: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
 
     __table_args__ = (
         UniqueConstraint("user_id", "vacancy_id", name="_user_vacancy_uc"),
+        # Keyset pagination of a user's history by (created_at, id)
+        Index("ix_applications_user_created", "user_id", "created_at", "id"),
     )
\ No newline at end of file
@@ -0,0 +1,20 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hh.libs.base_model import Base
+
+
+class ApplicationStatsModel(Base):
+    """Per-user daily application counts by status, maintained with every application write."""
+    __tablename__ = "application_daily_stats"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    day: Mapped[date] = mapped_column(Date)
+    status: Mapped[str] = mapped_column(String)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", "status", name="_user_day_status_uc"),
+    )
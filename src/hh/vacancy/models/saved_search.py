@@ -0,0 +1,20 @@
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, Integer, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hh.libs.base_model import Base
+
+
+class SavedSearchModel(Base):
+    """An additional search query of a user, run together with the query of the user's settings."""
+    __tablename__ = "saved_searches"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    name: Mapped[str] = mapped_column(String)
+    search_text: Mapped[str] = mapped_column(String)
+    area_id: Mapped[str] = mapped_column(String)
+    salary: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    schedule: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    employment: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -1,6 +1,7 @@
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String, Text, Integer
+from sqlalchemy import ForeignKey, String, Text, Integer, Float
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
 from hh.libs.base_model import Base
@@ -21,4 +22,10 @@ class SearchSettingsModel(Base):
     schedule: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     employment: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     order_by: Mapped[str] = mapped_column(String)
-    cover_letter: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
\ No newline at end of file
+    cover_letter: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Pre-apply filters
+    excluded_employer_ids: Mapped[list[str]] = mapped_column(ARRAY(String), default=list, server_default="{}")
+    excluded_title_keywords: Mapped[list[str]] = mapped_column(ARRAY(String), default=list, server_default="{}")
+
+    # Vacancies scoring below this relevance to the resume are not applied to
+    min_relevance: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
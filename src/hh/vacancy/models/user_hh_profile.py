@@ -1,4 +1,7 @@
-from sqlalchemy import ForeignKey, String, Integer, Boolean, UniqueConstraint
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, Integer, Boolean, DateTime, UniqueConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from hh.libs.base_model import Base
@@ -13,3 +16,14 @@ class UserHHProfileModel(Base):
     access_token: Mapped[str] = mapped_column(String)
     refresh_token: Mapped[str] = mapped_column(String)
     is_bot_active: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Adaptive schedule of periodic runs, NULL until the first run finishes
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    run_interval: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_yield: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Update time of the newest HH negotiation copied into applications
+    negotiations_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Keyset scans of due active users by the run dispatcher
+        Index("ix_hh_profiles_active_user", "user_id", "next_run_at", postgresql_where=text("is_bot_active")),
+    )
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Integer, Boolean, TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hh.libs.base_model import Base
+
+
+class VacancyModel(Base):
+    """
+    Metadata of vacancies found by searches, stored once for all users.
+
+    Keyed by the HH vacancy ID.
+    """
+    __tablename__ = "vacancies"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    employer_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    title: Mapped[str] = mapped_column(String)
+    salary_from: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    salary_to: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    salary_currency: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    archived: Mapped[bool] = mapped_column(Boolean, default=False)
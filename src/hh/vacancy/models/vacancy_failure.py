@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, TIMESTAMP, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hh.libs.base_model import Base
+
+
+class VacancyFailureModel(Base):
+    """
+    Negative cache of vacancies that permanently failed to accept an application.
+
+    Rows with an empty user_id are vacancy-level failures shared by all users.
+    """
+    __tablename__ = "vacancy_failures"
+
+    user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True, index=True)
+    vacancy_id: Mapped[str] = mapped_column(String, index=True)
+    reason: Mapped[str] = mapped_column(String)
+    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), index=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "vacancy_id",
+            name="_failure_user_vacancy_uc",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from hh.libs.redis.client import RedisHelper, redis_helper
+from hh.vacancy.dto import RunProgressDTO, BotStatusDTO
+from hh.vacancy.exceptions import BotStatusUnavailable
+
+logger = logging.getLogger(__name__)
+
+# Seconds without events after which relays send a keepalive
+KEEPALIVE_INTERVAL = 15.0
+
+# A run that has not reported for this long is considered dead (e.g. a killed worker)
+RUN_STALE_AFTER = timedelta(minutes=10)
+
+# Status of users that stopped using the bot eventually expires
+STATUS_TTL = timedelta(days=30)
+
+
+def progress_channel(user_id: int) -> str:
+    return f"hh:progress:{user_id}"
+
+
+def bot_status_key(user_id: int) -> str:
+    return f"hh:bot:{user_id}"
+
+
+async def publish_progress(user_id: int, progress: RunProgressDTO) -> None:
+    """
+    Publishes the state of a user's run and records it in the bot status hash,
+    in one round-trip. Progress is informational, so failures are only logged.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    status = {
+        "state": "running" if progress.state == "running" else "idle",
+        "updated_at": now,
+        **progress.model_dump(
+            mode="json",
+            include={"page", "applied", "skipped", "errors", "quota_remaining", "next_run_at"},
+            exclude_none=True,
+        ),
+    }
+    if progress.state == "finished":
+        status["last_run_at"] = now
+
+    key = bot_status_key(user_id)
+    try:
+        async with redis_helper.client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=status)
+            pipe.expire(key, STATUS_TTL)
+            pipe.publish(progress_channel(user_id), progress.model_dump_json())
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to publish progress of user {user_id}: {e}")
+
+
+async def mark_queued(*user_ids: int) -> None:
+    """
+    Records that runs of the users were enqueued, in one round-trip.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    try:
+        async with redis_helper.client.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                key = bot_status_key(user_id)
+                pipe.hset(key, mapping={"state": "queued", "queued_at": now, "updated_at": now})
+                pipe.expire(key, STATUS_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to record queued runs of users {list(user_ids)}: {e}")
+
+
+async def mark_continuing(user_id: int) -> None:
+    """
+    Records that a run ran out of budget and its continuation was enqueued.
+    """
+    try:
+        await redis_helper.client.hset(
+            bot_status_key(user_id),
+            mapping={"state": "continuing", "updated_at": datetime.now(timezone.utc).isoformat()},
+        )
+    except RedisError as e:
+        logger.warning(f"Failed to record continuing state of user {user_id}: {e}")
+
+
+async def mark_idle(user_id: int) -> None:
+    """
+    Records that a queued run ended without running (e.g. the bot was stopped).
+    """
+    try:
+        await redis_helper.client.hset(
+            bot_status_key(user_id),
+            mapping={"state": "idle", "updated_at": datetime.now(timezone.utc).isoformat()},
+        )
+    except RedisError as e:
+        logger.warning(f"Failed to record idle state of user {user_id}: {e}")
+
+
+async def get_bot_status(user_id: int) -> BotStatusDTO:
+    """
+    Reads the bot status hash with a single HGETALL.
+
+    Returns:
+        The status; idle with empty counters if the user has no recorded runs.
+
+    Raises:
+        BotStatusUnavailable: If Redis cannot be reached.
+    """
+    try:
+        raw = await redis_helper.client.hgetall(bot_status_key(user_id))
+    except RedisError as e:
+        logger.warning(f"Failed to read bot status of user {user_id}: {e}")
+        raise BotStatusUnavailable from e
+    status = BotStatusDTO.model_validate(raw)
+
+    updated_at = raw.get("updated_at")
+    if status.state == "running" and updated_at:
+        if datetime.now(timezone.utc) - datetime.fromisoformat(updated_at) > RUN_STALE_AFTER:
+            status.state = "idle"
+    return status
+
+
+class ProgressSubscriber:
+    """
+    Mailbox of one connection that keeps only the latest event, so a slow
+    client skips intermediate states instead of accumulating a backlog.
+    """
+
+    def __init__(self):
+        self._latest: Optional[str] = None
+        self._ready = asyncio.Event()
+
+    def push(self, data: str) -> None:
+        self._latest = data
+        self._ready.set()
+
+    async def next(self, timeout: float) -> Optional[str]:
+        """
+        Waits for the next event.
+
+        Args:
+            timeout: Seconds to wait.
+
+        Returns:
+            The latest event as JSON, or None on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._ready.clear()
+        data, self._latest = self._latest, None
+        return data
+
+
+class ProgressHub:
+    """
+    Relays progress channels to the connections of this process.
+
+    All connections share one Redis pub/sub connection; a channel is
+    subscribed while at least one connection of its user is open.
+    """
+
+    def __init__(self, redis: RedisHelper):
+        self.redis = redis
+        self._pubsub: Optional[PubSub] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._subscribers: dict[str, set[ProgressSubscriber]] = {}
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[ProgressSubscriber]:
+        """
+        Subscribes a connection to the progress of a user's runs.
+
+        Raises:
+            RedisError: If the channel could not be subscribed.
+        """
+        channel = progress_channel(user_id)
+        subscriber = ProgressSubscriber()
+
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self.redis.client.pubsub(ignore_subscribe_messages=True)
+            if channel not in self._subscribers:
+                await self._pubsub.subscribe(channel)
+                self._subscribers[channel] = set()
+            self._subscribers[channel].add(subscriber)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read())
+
+        try:
+            yield subscriber
+        finally:
+            async with self._lock:
+                subscribers = self._subscribers.get(channel, set())
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(channel, None)
+                    try:
+                        await self._pubsub.unsubscribe(channel)
+                    except RedisError as e:
+                        logger.warning(f"Failed to unsubscribe from {channel}: {e}")
+
+    async def _read(self) -> None:
+        while self._subscribers:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except RedisError as e:
+                # The pub/sub connection resubscribes its channels when it reconnects
+                logger.warning(f"Progress relay failed: {e}")
+                await asyncio.sleep(1)
+                continue
+            if message is None or message["type"] != "message":
+                continue
+            for subscriber in self._subscribers.get(message["channel"], ()):
+                subscriber.push(message["data"])
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._subscribers.clear()
+
+
+progress_hub = ProgressHub(redis_helper)
@@ -1,15 +1,40 @@
-from typing import Optional
-from sqlalchemy import select, insert, update
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Iterable, AsyncIterator, List
+from sqlalchemy import Select, select, update, delete, union, or_, func, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from hh.config.database.session import ISession
-from hh.vacancy.models import SearchSettingsModel, ApplicationModel, UserHHProfileModel
-from hh.vacancy.dto import SearchSettingsDTO
+from hh.config.project import settings as project_settings
+from hh.vacancy.models import (
+    SearchSettingsModel,
+    ApplicationModel,
+    ApplicationStatsModel,
+    UserHHProfileModel,
+    VacancyFailureModel,
+    SavedSearchModel,
+    VacancyModel,
+)
+from hh.vacancy.cache import settings_cache, profile_cache
+from hh.vacancy.exceptions import SavedSearchNotFound
+from hh.vacancy.dto import (
+    SearchSettingsDTO,
+    HHProfileDTO,
+    HHCredentialsDTO,
+    ApplicationFilterDTO,
+    ApplicationRecordDTO,
+    SavedSearchDTO,
+    SavedSearchCreateDTO,
+    VacancyDTO,
+)
 
 
 class VacancyRepository:
     """
     Repository for managing Vacancy, Application, and Profile data.
+
+    Search settings and HH profiles are read through a cache and every write
+    to them invalidates the cached copy.
     """
 
     def __init__(self, session: ISession):
@@ -21,7 +46,7 @@ class VacancyRepository:
         """
         self.session = session
 
-    async def get_settings(self, user_id: int) -> Optional[SearchSettingsModel]:
+    async def get_settings(self, user_id: int) -> Optional[SearchSettingsDTO]:
         """
         Retrieve search settings for a user.
 
@@ -29,13 +54,61 @@ class VacancyRepository:
             user_id: The ID of the user.
 
         Returns:
-            The search settings model or None.
+            The search settings or None.
         """
+        cached = await settings_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        generation = await settings_cache.generation(user_id)
         stmt = select(SearchSettingsModel).where(SearchSettingsModel.user_id == user_id)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        model = result.scalar_one_or_none()
+        if model is None:
+            return None
+
+        dto = SearchSettingsDTO.model_validate(model)
+        if generation is not None:
+            await settings_cache.set(user_id, dto, generation=generation)
+        return dto
+
+    async def get_run_context(self, user_id: int) -> tuple[Optional[HHProfileDTO], Optional[SearchSettingsDTO]]:
+        """
+        Retrieve the HH profile and search settings together, as needed at the start of a run.
+
+        Served from the cache when both are cached, otherwise loaded with one join.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The profile and the settings, each None if missing.
+        """
+        profile = await profile_cache.get(user_id)
+        settings = await settings_cache.get(user_id)
+        if profile is not None and settings is not None:
+            return profile, settings
+
+        profile_generation = await profile_cache.generation(user_id)
+        settings_generation = await settings_cache.generation(user_id)
+        stmt = select(UserHHProfileModel, SearchSettingsModel).outerjoin(
+            SearchSettingsModel, SearchSettingsModel.user_id == UserHHProfileModel.user_id
+        ).where(UserHHProfileModel.user_id == user_id)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None, settings
 
-    async def upsert_settings(self, user_id: int, dto: SearchSettingsDTO) -> SearchSettingsModel:
+        profile = HHProfileDTO.model_validate(row[0])
+        if profile_generation is not None:
+            await profile_cache.set(user_id, profile, generation=profile_generation)
+        if row[1] is not None:
+            settings = SearchSettingsDTO.model_validate(row[1])
+            if settings_generation is not None:
+                await settings_cache.set(user_id, settings, generation=settings_generation)
+        return profile, settings
+
+    async def upsert_settings(self, user_id: int, dto: SearchSettingsDTO) -> SearchSettingsDTO:
         """
         Create or update search settings.
 
@@ -44,7 +117,7 @@ class VacancyRepository:
             dto: Data transfer object with settings.
 
         Returns:
-            The updated/created model.
+            The updated/created settings.
         """
         values = dto.model_dump(exclude_unset=True)
         values["user_id"] = user_id
@@ -55,10 +128,19 @@ class VacancyRepository:
         ).returning(SearchSettingsModel)
 
         result = await self.session.execute(stmt)
+        settings = SearchSettingsDTO.model_validate(result.scalar_one())
         await self.session.commit()
-        return result.scalar_one()
+        # Invalidated rather than written through, see _write_profile
+        await settings_cache.delete(user_id)
+        return settings
 
-    async def log_application(self, user_id: int, vacancy_id: str, status: str):
+    async def log_application(
+            self,
+            user_id: int,
+            vacancy_id: str,
+            status: str,
+            signature: Optional[int] = None
+    ):
         """
         Log an application attempt.
 
@@ -66,13 +148,117 @@ class VacancyRepository:
             user_id: The user ID.
             vacancy_id: The external vacancy ID.
             status: Result status (e.g., 'applied', 'error').
+            signature: Signed 64-bit SimHash of the vacancy, if known.
         """
-        stmt = insert(ApplicationModel).values(
-            user_id=user_id, vacancy_id=vacancy_id, status=status
+        await self.log_applications(
+            user_id, [ApplicationRecordDTO(vacancy_id=vacancy_id, status=status, signature=signature)]
+        )
+
+    @staticmethod
+    def stats_day(moment: datetime) -> date:
+        """
+        The statistics day of a moment, in the project's timezone.
+        """
+        return (moment.astimezone(timezone.utc) + timedelta(hours=project_settings.timezone_shift)).date()
+
+    async def upsert_vacancies(self, vacancies: Iterable[VacancyDTO]):
+        """
+        Write vacancy metadata to the shared vacancies table with one statement.
+
+        Rows whose data did not change are left untouched. Rows are written in
+        ID order, so concurrent upserts of overlapping pages lock them in the
+        same order.
+
+        Args:
+            vacancies: Vacancies of a search page; repeated IDs keep the last one.
+        """
+        rows = {vacancy.id: vacancy.model_dump() for vacancy in vacancies}
+        if not rows:
+            return
+
+        stmt = pg_insert(VacancyModel).values([rows[key] for key in sorted(rows)])
+        columns = [name for name in VacancyDTO.model_fields if name != "id"]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VacancyModel.id],
+            set_={**{name: stmt.excluded[name] for name in columns}, "updated_at": func.now()},
+            where=or_(*(
+                getattr(VacancyModel, name).is_distinct_from(stmt.excluded[name]) for name in columns
+            ))
         )
         await self.session.execute(stmt)
         await self.session.commit()
 
+    async def log_applications(self, user_id: int, records: List[ApplicationRecordDTO], errors: int = 0):
+        """
+        Write a batch of application outcomes and update the daily statistics
+        in the same transaction.
+
+        Records for vacancies already in the history are ignored and not counted.
+        The vacancies must already be in the vacancies table.
+
+        Args:
+            user_id: The user ID.
+            records: Outcomes to write.
+            errors: Number of failed attempts to count as 'error' for today.
+        """
+        counts: Counter[tuple[date, str]] = Counter()
+
+        if records:
+            now = datetime.now(timezone.utc)
+            values = [
+                {
+                    "user_id": user_id,
+                    "vacancy_id": record.vacancy_id,
+                    "status": record.status,
+                    "signature": record.signature,
+                    "created_at": record.created_at or now,
+                }
+                for record in records
+            ]
+
+            stmt = pg_insert(ApplicationModel).values(values).on_conflict_do_nothing(
+                constraint="_user_vacancy_uc"
+            ).returning(ApplicationModel.status, ApplicationModel.created_at)
+            result = await self.session.execute(stmt)
+            for status, created_at in result:
+                counts[(self.stats_day(created_at), status)] += 1
+
+        if errors:
+            counts[(self.stats_day(datetime.now(timezone.utc)), "error")] += errors
+
+        if counts:
+            stmt = pg_insert(ApplicationStatsModel).values([
+                {"user_id": user_id, "day": day, "status": status, "count": count}
+                for (day, status), count in counts.items()
+            ])
+            stmt = stmt.on_conflict_do_update(
+                constraint="_user_day_status_uc",
+                set_={"count": ApplicationStatsModel.count + stmt.excluded.count}
+            )
+            await self.session.execute(stmt)
+
+        await self.session.commit()
+
+    async def get_stats(self, user_id: int, since: date) -> List[tuple[date, str, int]]:
+        """
+        Read the user's daily statistics from the rollup table.
+
+        Args:
+            user_id: The user ID.
+            since: First day to include.
+
+        Returns:
+            Tuples of (day, status, count).
+        """
+        stmt = select(
+            ApplicationStatsModel.day, ApplicationStatsModel.status, ApplicationStatsModel.count
+        ).where(
+            ApplicationStatsModel.user_id == user_id,
+            ApplicationStatsModel.day >= since
+        )
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result]
+
     async def is_applied(self, user_id: int, vacancy_id: str) -> bool:
         """
         Check if the user has already applied to this vacancy locally.
@@ -91,7 +277,141 @@ class VacancyRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    async def get_hh_profile(self, user_id: int) -> Optional[UserHHProfileModel]:
+    async def get_recent_signatures(self, user_id: int, since: datetime) -> list[int]:
+        """
+        Retrieve SimHash signatures of the user's applications since a moment.
+
+        Args:
+            user_id: The user ID.
+            since: Start of the lookback window.
+
+        Returns:
+            Signed 64-bit signatures as stored.
+        """
+        stmt = select(ApplicationModel.signature).where(
+            ApplicationModel.user_id == user_id,
+            ApplicationModel.signature.is_not(None),
+            ApplicationModel.created_at >= since
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_processed_vacancy_ids(self, user_id: int, vacancy_ids: Iterable[str]) -> set[str]:
+        """
+        Select the vacancies of a batch that must not be applied to again.
+
+        A vacancy is processed if the user already has an application record for it
+        or if it is in the negative cache (for this user or fleet-wide) and not expired.
+
+        Args:
+            user_id: The user ID.
+            vacancy_ids: External vacancy IDs to check.
+
+        Returns:
+            The subset of vacancy_ids to skip.
+        """
+        vacancy_ids = list(vacancy_ids)
+        if not vacancy_ids:
+            return set()
+
+        applied = select(ApplicationModel.vacancy_id).where(
+            ApplicationModel.user_id == user_id,
+            ApplicationModel.vacancy_id.in_(vacancy_ids)
+        )
+        failed = select(VacancyFailureModel.vacancy_id).where(
+            or_(VacancyFailureModel.user_id == user_id, VacancyFailureModel.user_id.is_(None)),
+            VacancyFailureModel.vacancy_id.in_(vacancy_ids),
+            VacancyFailureModel.expires_at > func.now()
+        )
+        result = await self.session.execute(union(applied, failed))
+        return set(result.scalars().all())
+
+    async def record_failure(
+            self,
+            vacancy_id: str,
+            reason: str,
+            expires_at: datetime,
+            user_id: Optional[int] = None
+    ):
+        """
+        Remember a permanent application failure until it expires.
+
+        Args:
+            vacancy_id: The external vacancy ID.
+            reason: HH error value that caused the failure.
+            expires_at: When the vacancy may be retried.
+            user_id: The user the failure applies to, or None for all users.
+        """
+        values = {
+            "user_id": user_id,
+            "vacancy_id": vacancy_id,
+            "reason": reason,
+            "expires_at": expires_at,
+        }
+
+        stmt = pg_insert(VacancyFailureModel).values(**values).on_conflict_do_update(
+            constraint="_failure_user_vacancy_uc",
+            set_={"reason": reason, "expires_at": expires_at}
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    @staticmethod
+    def _applications_query(user_id: int, filters: ApplicationFilterDTO) -> Select:
+        stmt = select(ApplicationModel).where(ApplicationModel.user_id == user_id)
+        if filters.status is not None:
+            stmt = stmt.where(ApplicationModel.status == filters.status)
+        if filters.date_from is not None:
+            stmt = stmt.where(ApplicationModel.created_at >= filters.date_from)
+        if filters.date_to is not None:
+            stmt = stmt.where(ApplicationModel.created_at < filters.date_to)
+        return stmt.order_by(ApplicationModel.created_at.desc(), ApplicationModel.id.desc())
+
+    async def get_applications_page(
+            self,
+            user_id: int,
+            filters: ApplicationFilterDTO,
+            limit: int = 100,
+            before: Optional[tuple[datetime, int]] = None
+    ) -> List[ApplicationModel]:
+        """
+        Keyset page of the user's applications, newest first.
+
+        Args:
+            user_id: The user ID.
+            filters: Status and date range filters.
+            limit: Maximum number of rows.
+            before: (created_at, id) of the last row of the previous page.
+
+        Returns:
+            Application models ordered by (created_at, id) descending.
+        """
+        stmt = self._applications_query(user_id, filters).limit(limit)
+        if before is not None:
+            stmt = stmt.where(tuple_(ApplicationModel.created_at, ApplicationModel.id) < before)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def stream_applications(
+            self,
+            user_id: int,
+            filters: ApplicationFilterDTO,
+            batch_size: int = 1000
+    ) -> AsyncIterator[ApplicationModel]:
+        """
+        Streams the user's applications, newest first, through a server-side cursor.
+
+        Args:
+            user_id: The user ID.
+            filters: Status and date range filters.
+            batch_size: Rows fetched from the cursor at a time.
+        """
+        stmt = self._applications_query(user_id, filters).execution_options(yield_per=batch_size)
+        result = await self.session.stream_scalars(stmt)
+        async for application in result:
+            yield application
+
+    async def get_hh_profile(self, user_id: int) -> Optional[HHProfileDTO]:
         """
         Get the user's HH OAuth profile.
 
@@ -99,13 +419,63 @@ class VacancyRepository:
             user_id: The internal user ID.
 
         Returns:
-            UserHHProfileModel or None.
+            HHProfileDTO or None.
         """
+        cached = await profile_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        generation = await profile_cache.generation(user_id)
         stmt = select(UserHHProfileModel).where(UserHHProfileModel.user_id == user_id)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        model = result.scalar_one_or_none()
+        if model is None:
+            return None
 
-    async def upsert_hh_profile(self, user_id: int, access_token: str, refresh_token: str):
+        profile = HHProfileDTO.model_validate(model)
+        if generation is not None:
+            await profile_cache.set(user_id, profile, generation=generation)
+        return profile
+
+    async def get_hh_credentials(self, user_id: int) -> Optional[HHCredentialsDTO]:
+        """
+        Get the user's HH OAuth tokens, bypassing the cache.
+
+        Refresh tokens are single-use and rotated by concurrent tasks, so they
+        are always read from the database.
+
+        Args:
+            user_id: The internal user ID.
+
+        Returns:
+            HHCredentialsDTO or None if HH is not connected.
+        """
+        stmt = select(UserHHProfileModel.access_token, UserHHProfileModel.refresh_token).where(
+            UserHHProfileModel.user_id == user_id
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return HHCredentialsDTO.model_validate(row) if row is not None else None
+
+    async def _write_profile(self, stmt) -> Optional[HHProfileDTO]:
+        result = await self.session.execute(stmt.returning(UserHHProfileModel))
+        model = result.scalar_one_or_none()
+        profile = HHProfileDTO.model_validate(model) if model is not None else None
+        await self.session.commit()
+        # A write-through could race with a reader putting back the row it
+        # loaded before the update, e.g. with an already used refresh token.
+        # Invalidation moves the key to a new generation, which drops such writes.
+        if profile is not None:
+            await profile_cache.delete(profile.user_id)
+        return profile
+
+    async def upsert_hh_profile(
+            self,
+            user_id: int,
+            access_token: str,
+            refresh_token: str,
+            hh_id: Optional[int] = None
+    ):
         """
         Create or update the HH profile tokens.
 
@@ -113,10 +483,11 @@ class VacancyRepository:
             user_id: The internal user ID.
             access_token: New access token.
             refresh_token: New refresh token.
+            hh_id: The external HH user ID, defaults to the internal one.
         """
         values = {
             "user_id": user_id,
-            "hh_id": user_id,
+            "hh_id": hh_id if hh_id is not None else user_id,
             "access_token": access_token,
             "refresh_token": refresh_token
         }
@@ -128,8 +499,7 @@ class VacancyRepository:
                 "refresh_token": refresh_token
             }
         )
-        await self.session.execute(stmt)
-        await self.session.commit()
+        await self._write_profile(stmt)
 
     async def update_tokens(self, user_id: int, access_token: str, refresh_token: str):
         """
@@ -146,8 +516,7 @@ class VacancyRepository:
             access_token=access_token,
             refresh_token=refresh_token
         )
-        await self.session.execute(stmt)
-        await self.session.commit()
+        await self._write_profile(stmt)
 
     async def update_bot_state(self, user_id: int, is_active: bool):
         """
@@ -158,5 +527,126 @@ class VacancyRepository:
             is_active: The target state.
         """
         stmt = update(UserHHProfileModel).where(UserHHProfileModel.user_id == user_id).values(is_bot_active=is_active)
-        await self.session.execute(stmt)
-        await self.session.commit()
\ No newline at end of file
+        await self._write_profile(stmt)
+
+    async def update_schedule(self, user_id: int, next_run_at: datetime, run_interval: int, last_yield: Optional[int]):
+        """
+        Store the schedule computed after a run.
+
+        Args:
+            user_id: The internal user ID.
+            next_run_at: When the next periodic run is due.
+            run_interval: Interval used to compute next_run_at, in seconds.
+            last_yield: New vacancies found by the finished run, None to keep the previous one.
+        """
+        values = {"next_run_at": next_run_at, "run_interval": run_interval}
+        if last_yield is not None:
+            values["last_yield"] = last_yield
+        stmt = update(UserHHProfileModel).where(UserHHProfileModel.user_id == user_id).values(**values)
+        await self._write_profile(stmt)
+
+    async def update_negotiations_marker(self, user_id: int, synced_at: datetime):
+        """
+        Store the update time of the newest negotiation copied from HH.
+
+        Args:
+            user_id: The internal user ID.
+            synced_at: The next negotiations sync stops at this time.
+        """
+        stmt = update(UserHHProfileModel).where(UserHHProfileModel.user_id == user_id).values(
+            negotiations_synced_at=synced_at
+        )
+        await self._write_profile(stmt)
+
+    @staticmethod
+    def _due(moment: datetime):
+        return (
+            UserHHProfileModel.is_bot_active,
+            or_(UserHHProfileModel.next_run_at.is_(None), UserHHProfileModel.next_run_at <= moment),
+        )
+
+    async def count_due_users(self, moment: datetime) -> int:
+        """
+        Count users with the bot enabled whose next run is due at the given moment.
+        """
+        stmt = select(func.count()).select_from(UserHHProfileModel).where(*self._due(moment))
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def get_due_user_ids(self, moment: datetime, after_user_id: int, limit: int) -> list[int]:
+        """
+        Get the next chunk of users with the bot enabled whose next run is due,
+        in user ID order.
+
+        Args:
+            moment: Users scheduled up to this moment are due.
+            after_user_id: Last user ID of the previous chunk, 0 for the first one.
+            limit: Chunk size.
+
+        Returns:
+            User IDs.
+        """
+        stmt = select(UserHHProfileModel.user_id).where(
+            *self._due(moment),
+            UserHHProfileModel.user_id > after_user_id
+        ).order_by(UserHHProfileModel.user_id).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_saved_searches(self, user_id: int, active_only: bool = False) -> List[SavedSearchDTO]:
+        """
+        Get the user's saved searches in creation order.
+
+        Args:
+            user_id: The internal user ID.
+            active_only: Return only the searches included in runs.
+        """
+        stmt = select(SavedSearchModel).where(SavedSearchModel.user_id == user_id).order_by(SavedSearchModel.id)
+        if active_only:
+            stmt = stmt.where(SavedSearchModel.is_active)
+        result = await self.session.execute(stmt)
+        return [SavedSearchDTO.model_validate(model) for model in result.scalars()]
+
+    async def count_saved_searches(self, user_id: int) -> int:
+        stmt = select(func.count()).select_from(SavedSearchModel).where(SavedSearchModel.user_id == user_id)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def create_saved_search(self, user_id: int, dto: SavedSearchCreateDTO) -> SavedSearchDTO:
+        model = SavedSearchModel(user_id=user_id, **dto.model_dump())
+        self.session.add(model)
+        await self.session.commit()
+        return SavedSearchDTO.model_validate(model)
+
+    async def update_saved_search(self, user_id: int, search_id: int, dto: SavedSearchCreateDTO) -> SavedSearchDTO:
+        """
+        Replace a saved search of the user.
+
+        Raises:
+            SavedSearchNotFound: If the user has no such search.
+        """
+        stmt = update(SavedSearchModel).where(
+            SavedSearchModel.id == search_id,
+            SavedSearchModel.user_id == user_id
+        ).values(**dto.model_dump()).returning(SavedSearchModel)
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        if model is None:
+            raise SavedSearchNotFound
+        search = SavedSearchDTO.model_validate(model)
+        await self.session.commit()
+        return search
+
+    async def delete_saved_search(self, user_id: int, search_id: int) -> None:
+        """
+        Delete a saved search of the user.
+
+        Raises:
+            SavedSearchNotFound: If the user has no such search.
+        """
+        stmt = delete(SavedSearchModel).where(
+            SavedSearchModel.id == search_id,
+            SavedSearchModel.user_id == user_id
+        ).returning(SavedSearchModel.id)
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            raise SavedSearchNotFound
+        await self.session.commit()
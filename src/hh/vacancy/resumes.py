@@ -0,0 +1,96 @@
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from hh.config.cache import settings as cache_settings
+from hh.integration.hh.service import HHIntegrationService
+from hh.libs.cache.tiered import TieredCache
+from hh.libs.redis.client import redis_helper
+from hh.vacancy.dto import CachedResumesDTO
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeCache:
+    """
+    Per-user cache of the HH resume list with stale-while-revalidate semantics.
+
+    Entries are fresh for fresh_ttl seconds and then served as stale, while one
+    background refresh is claimed through a Redis lock, until stale_ttl expires
+    them. Reconnecting the HH account invalidates the entry.
+    """
+
+    def __init__(self, fresh_ttl: float, stale_ttl: float, lock_ttl: float):
+        """
+        Args:
+            fresh_ttl: Age in seconds after which an entry should be refreshed.
+            stale_ttl: Age in seconds after which an entry is dropped.
+            lock_ttl: Lifetime of the refresh lock, bounds refreshes per user.
+        """
+        self.fresh_ttl = fresh_ttl
+        self.lock_ttl = lock_ttl
+        self._cache: TieredCache[CachedResumesDTO] = TieredCache(
+            namespace="vacancy:resumes",
+            model=CachedResumesDTO,
+            ttl=stale_ttl,
+            local_ttl=cache_settings.vacancy_cache_local_ttl,
+            maxsize=cache_settings.vacancy_cache_size,
+            redis=redis_helper,
+        )
+
+    def is_stale(self, entry: CachedResumesDTO) -> bool:
+        age = (datetime.now(timezone.utc) - entry.fetched_at).total_seconds()
+        return age >= self.fresh_ttl
+
+    async def get(self, user_id: int) -> Optional[CachedResumesDTO]:
+        return await self._cache.get(user_id)
+
+    async def fetch(self, hh_service: HHIntegrationService, user_id: int, token: str) -> CachedResumesDTO:
+        """
+        Fetches the resume list from HH and caches it.
+
+        Args:
+            hh_service: Service to communicate with HH.
+            user_id: The internal user ID.
+            token: Valid access token.
+
+        Returns:
+            The cached entry.
+        """
+        items = await hh_service.get_my_resumes(token)
+        entry = CachedResumesDTO(fetched_at=datetime.now(timezone.utc), items=items)
+        await self._cache.set(user_id, entry)
+        return entry
+
+    async def claim_refresh(self, user_id: int) -> bool:
+        """
+        Takes the per-user refresh lock.
+
+        Returns:
+            True if the caller should schedule the refresh.
+        """
+        try:
+            return bool(await redis_helper.client.set(
+                f"vacancy:resumes:refresh:{user_id}", 1, nx=True, ex=max(1, int(self.lock_ttl))
+            ))
+        except RedisError as e:
+            logger.warning(f"Resume refresh lock failed for user {user_id}: {e}")
+            return False
+
+    async def release_refresh(self, user_id: int) -> None:
+        try:
+            await redis_helper.client.delete(f"vacancy:resumes:refresh:{user_id}")
+        except RedisError as e:
+            logger.warning(f"Resume refresh unlock failed for user {user_id}: {e}")
+
+    async def invalidate(self, user_id: int) -> None:
+        await self._cache.delete(user_id)
+
+
+resume_cache = ResumeCache(
+    fresh_ttl=cache_settings.resume_cache_fresh_ttl,
+    stale_ttl=cache_settings.resume_cache_stale_ttl,
+    lock_ttl=cache_settings.resume_refresh_lock_ttl,
+)
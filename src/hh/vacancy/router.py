@@ -1,10 +1,30 @@
 # /home/jj/code/HeadHunterAutoApplier/src/hh/vacancy/router.py
-from typing import List
-from fastapi import APIRouter, HTTPException
-from hh.security.dependencies import ICurrentUser
-from hh.vacancy.dto import SearchSettingsDTO, SearchSettingsUpdateDTO
+from datetime import datetime
+from typing import List, Optional, Literal, AsyncIterator
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from hh.auth.dependencies.current_user import ICurrentUser
+from hh.config.database.session import ISession
+from hh.libs.exceptions import PaginationError
+from hh.vacancy.dto import (
+    SearchSettingsDTO,
+    SearchSettingsUpdateDTO,
+    ApplicationPageDTO,
+    ApplicationFilterDTO,
+    ApplicationStatsDTO,
+    BotStatusDTO,
+    SavedSearchDTO,
+    SavedSearchCreateDTO,
+    AreaSuggestionDTO,
+)
+from hh.vacancy.exceptions import (
+    SavedSearchNotFound,
+    SavedSearchLimitReached,
+    InvalidSearchSettings,
+    BotStatusUnavailable,
+)
 from hh.vacancy.dependencies.service import IVacancyService
-from hh.integration.hh.dependencies.service import IHHService
+from hh.vacancy.progress import progress_hub, KEEPALIVE_INTERVAL
 
 router = APIRouter(prefix="/vacancies", tags=["Vacancies"])
 
@@ -21,17 +41,74 @@ async def update_settings(
     user: ICurrentUser,
     service: IVacancyService
 ):
-    return await service.upsert_settings(user.id, dto)
+    try:
+        return await service.upsert_settings(user.id, dto)
+    except InvalidSearchSettings as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+@router.get("/areas/suggest", response_model=List[AreaSuggestionDTO])
+async def suggest_areas(
+    user: ICurrentUser,
+    service: IVacancyService,
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """Autocomplete of HH areas by the beginning of any word of their name, served from the local snapshot."""
+    suggestions = service.suggest_areas(q, limit)
+    if suggestions is None:
+        raise HTTPException(status_code=503, detail="Areas are not loaded yet")
+    return suggestions
+
+@router.get("/searches", response_model=List[SavedSearchDTO])
+async def get_saved_searches(user: ICurrentUser, service: IVacancyService):
+    return await service.get_saved_searches(user.id)
+
+@router.post("/searches", response_model=SavedSearchDTO, status_code=201)
+async def create_saved_search(
+    dto: SavedSearchCreateDTO,
+    user: ICurrentUser,
+    service: IVacancyService
+):
+    """Add a search query that runs next to the main settings query, sharing its filters and resume."""
+    try:
+        return await service.create_saved_search(user.id, dto)
+    except InvalidSearchSettings as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except SavedSearchLimitReached:
+        raise HTTPException(
+            status_code=409,
+            detail=f"At most {service.MAX_SAVED_SEARCHES} saved searches are allowed"
+        )
+
+@router.put("/searches/{search_id}", response_model=SavedSearchDTO)
+async def update_saved_search(
+    search_id: int,
+    dto: SavedSearchCreateDTO,
+    user: ICurrentUser,
+    service: IVacancyService
+):
+    try:
+        return await service.update_saved_search(user.id, search_id, dto)
+    except InvalidSearchSettings as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except SavedSearchNotFound:
+        raise HTTPException(status_code=404, detail="Saved search not found")
+
+@router.delete("/searches/{search_id}", status_code=204)
+async def delete_saved_search(search_id: int, user: ICurrentUser, service: IVacancyService):
+    try:
+        await service.delete_saved_search(user.id, search_id)
+    except SavedSearchNotFound:
+        raise HTTPException(status_code=404, detail="Saved search not found")
 
 @router.get("/resumes")
 async def get_my_resumes(
     user: ICurrentUser,
     service: IVacancyService,
-    hh_service: IHHService
 ):
     """Get resumes from HH to populate dropdowns on frontend."""
     try:
-        return await service.get_resumes(user.id, hh_service)
+        return await service.get_resumes(user.id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -41,4 +118,73 @@ async def start_bot(user: ICurrentUser, service: IVacancyService):
 
 @router.post("/bot/stop")
 async def stop_bot(user: ICurrentUser, service: IVacancyService):
-    return await service.set_bot_state(user.id, is_active=False)
\ No newline at end of file
+    return await service.set_bot_state(user.id, is_active=False)
+
+@router.get("/bot/status", response_model=BotStatusDTO)
+async def get_bot_status(user: ICurrentUser, service: IVacancyService):
+    """Run state (queued/continuing/running/idle), counters of the current or last run, and run times."""
+    try:
+        return await service.get_bot_status(user.id)
+    except BotStatusUnavailable:
+        raise HTTPException(
+            status_code=503,
+            detail="Bot status is temporarily unavailable",
+            headers={"Retry-After": "5"},
+        )
+
+async def _progress_events(user_id: int) -> AsyncIterator[str]:
+    async with progress_hub.subscribe(user_id) as subscriber:
+        while True:
+            data = await subscriber.next(KEEPALIVE_INTERVAL)
+            yield f"data: {data}\n\n" if data is not None else ": keepalive\n\n"
+
+@router.get("/progress")
+async def stream_progress(user: ICurrentUser, session: ISession):
+    """Server-sent events with the progress of the user's bot runs; only the latest state is delivered."""
+    # Authentication is done, don't hold a database connection for the lifetime of the stream
+    await session.close()
+    return StreamingResponse(
+        _progress_events(user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/stats", response_model=ApplicationStatsDTO)
+async def get_stats(user: ICurrentUser, service: IVacancyService):
+    """Application counts by status for today and the last 7 days."""
+    return await service.get_stats(user.id)
+
+@router.get("/applications", response_model=ApplicationPageDTO)
+async def get_applications(
+    user: ICurrentUser,
+    service: IVacancyService,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """Application history, newest first. Pass next_cursor to get the following page."""
+    filters = ApplicationFilterDTO(status=status, date_from=date_from, date_to=date_to)
+    try:
+        return await service.get_applications(user.id, filters, limit, cursor)
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/applications/export")
+async def export_applications(
+    user: ICurrentUser,
+    service: IVacancyService,
+    format: Literal["csv", "ndjson"] = "csv",
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """Stream the whole application history as CSV or NDJSON."""
+    filters = ApplicationFilterDTO(status=status, date_from=date_from, date_to=date_to)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        service.export_applications(user.id, filters, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=applications.{format}"},
+    )
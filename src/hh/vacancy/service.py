@@ -1,17 +1,43 @@
-from typing import Optional, List
+import csv
+import io
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, AsyncIterator, Literal
 
+from hh.libs.exceptions import PaginationError
+from hh.libs.pagination import encode_cursor, decode_cursor
 from hh.vacancy.dependencies.repository import IVacancyRepository
-from hh.vacancy.dto import SearchSettingsDTO, SearchSettingsUpdateDTO
-from hh.vacancy.models import UserHHProfileModel
+from hh.vacancy.dto import (
+    SearchSettingsDTO,
+    SearchSettingsUpdateDTO,
+    ApplicationLogDTO,
+    ApplicationPageDTO,
+    ApplicationFilterDTO,
+    ApplicationStatsDTO,
+    HHProfileDTO,
+    BotStatusDTO,
+    SavedSearchDTO,
+    SavedSearchCreateDTO,
+    AreaSuggestionDTO,
+)
+from hh.vacancy.dictionaries import hh_dictionaries
+from hh.vacancy.exceptions import SavedSearchLimitReached, InvalidSearchSettings
 from hh.integration.hh.dto import HHTokenDTO
 from hh.integration.hh.dependencies.service import IHHService
-from hh.worker.tasks import process_user_vacancies
+from hh.vacancy.progress import mark_queued, get_bot_status
+from hh.vacancy.resumes import resume_cache
+from hh.config.celery import INTERACTIVE_QUEUE
+from hh.worker.dispatcher import is_run_in_progress
+from hh.worker.tasks import process_user_vacancies, refresh_user_resumes, sync_user_negotiations
 
 
 class VacancyService:
     """
     Business logic for managing user's HH settings, profile, and bot state.
     """
+    MAX_PAGE_SIZE = 1000
+    MAX_SAVED_SEARCHES = 10
+    EXPORT_FIELDS = ("id", "vacancy_id", "status", "created_at")
 
     def __init__(self, repo: IVacancyRepository, hh_service: IHHService):
         self.repo = repo
@@ -23,6 +49,7 @@ class VacancyService:
         1. Exchanges code for tokens.
         2. Fetches HH user info (to get the real HH ID).
         3. Upserts the profile in the database.
+        4. Schedules a sync of the user's HH negotiations.
 
         Args:
             user_id: The application's internal user ID.
@@ -42,41 +69,124 @@ class VacancyService:
             access_token=tokens.access_token,
             refresh_token=tokens.refresh_token
         )
+        # The account may have changed, cached resumes belong to the old one
+        await resume_cache.invalidate(user_id)
+        # Applications sent on hh.ru before connecting are skipped by the bot
+        sync_user_negotiations.delay(user_id)
 
     async def get_settings(self, user_id: int) -> Optional[SearchSettingsDTO]:
-        model = await self.repo.get_settings(user_id)
-        if not model:
-            return None
-        return SearchSettingsDTO.model_validate(model)
+        return await self.repo.get_settings(user_id)
+
+    @staticmethod
+    def _check_search(area_id: str, **fields: Optional[str]) -> None:
+        """
+        Checks search parameters against the local snapshot of HH dictionaries.
+        Nothing is checked until the first snapshot is available.
+
+        Raises:
+            InvalidSearchSettings: If any value is unknown to HH.
+        """
+        dictionaries = hh_dictionaries.get()
+        if dictionaries is None:
+            return
+        errors = dictionaries.check(area_id=area_id, **fields)
+        if errors:
+            raise InvalidSearchSettings("; ".join(errors))
 
     async def upsert_settings(self, user_id: int, dto: SearchSettingsUpdateDTO) -> SearchSettingsDTO:
-        model = await self.repo.upsert_settings(user_id, dto)
-        return SearchSettingsDTO.model_validate(model)
+        """
+        Raises:
+            InvalidSearchSettings: If the area or a dictionary value is unknown to HH.
+        """
+        self._check_search(
+            dto.area_id,
+            currency=dto.currency,
+            schedule=dto.schedule,
+            employment=dto.employment,
+            order_by=dto.order_by
+        )
+        return await self.repo.upsert_settings(user_id, dto)
 
-    async def get_hh_profile(self, user_id: int) -> Optional[UserHHProfileModel]:
+    def suggest_areas(self, prefix: str, limit: int) -> Optional[List[AreaSuggestionDTO]]:
+        """
+        Areas matching the typed prefix, or None until the HH dictionaries are loaded.
+        """
+        dictionaries = hh_dictionaries.get()
+        if dictionaries is None:
+            return None
+        return dictionaries.suggest_areas(prefix, limit)
+
+    async def get_hh_profile(self, user_id: int) -> Optional[HHProfileDTO]:
         return await self.repo.get_hh_profile(user_id)
 
     async def set_bot_state(self, user_id: int, is_active: bool) -> dict:
         """
-        Enables or disables the bot. If enabled, triggers the worker task.
+        Enables or disables the bot. If enabled, triggers the worker task on the
+        interactive queue unless a run of the user is already in progress.
         """
         await self.repo.update_bot_state(user_id, is_active)
 
         if is_active:
-            # Trigger Celery Task
-            process_user_vacancies.delay(user_id)
+            if await is_run_in_progress(user_id):
+                return {"status": "running"}
+            # Trigger Celery Task, ahead of scheduled runs
+            await mark_queued(user_id)
+            process_user_vacancies.apply_async(args=[user_id], queue=INTERACTIVE_QUEUE)
             return {"status": "started"}
         return {"status": "stopped"}
 
+    async def get_saved_searches(self, user_id: int) -> List[SavedSearchDTO]:
+        return await self.repo.get_saved_searches(user_id)
+
+    async def create_saved_search(self, user_id: int, dto: SavedSearchCreateDTO) -> SavedSearchDTO:
+        """
+        Adds a saved search; active searches run next to the main settings query.
+
+        Raises:
+            SavedSearchLimitReached: If the user already has MAX_SAVED_SEARCHES searches.
+            InvalidSearchSettings: If the area or a dictionary value is unknown to HH.
+        """
+        self._check_search(dto.area_id, schedule=dto.schedule, employment=dto.employment)
+        if await self.repo.count_saved_searches(user_id) >= self.MAX_SAVED_SEARCHES:
+            raise SavedSearchLimitReached
+        return await self.repo.create_saved_search(user_id, dto)
+
+    async def update_saved_search(self, user_id: int, search_id: int, dto: SavedSearchCreateDTO) -> SavedSearchDTO:
+        self._check_search(dto.area_id, schedule=dto.schedule, employment=dto.employment)
+        return await self.repo.update_saved_search(user_id, search_id, dto)
+
+    async def delete_saved_search(self, user_id: int, search_id: int) -> None:
+        await self.repo.delete_saved_search(user_id, search_id)
+
+    async def get_bot_status(self, user_id: int) -> BotStatusDTO:
+        """
+        Run state and counters of the bot, read from Redis only.
+
+        Raises:
+            BotStatusUnavailable: If Redis cannot be reached.
+        """
+        return await get_bot_status(user_id)
+
     async def get_resumes(self, user_id: int) -> List[dict]:
         """
-        Fetches resumes from HH using the user's stored token.
+        Returns the user's HH resumes, cached with stale-while-revalidate.
+
+        A fresh entry is returned as is. A stale entry is returned too, and a
+        background refresh is scheduled unless one is already running. Only a
+        missing entry is fetched from HH inline.
         """
-        profile = await self.repo.get_hh_profile(user_id)
-        if not profile or not profile.access_token:
+        cached = await resume_cache.get(user_id)
+        if cached is not None:
+            if resume_cache.is_stale(cached) and await resume_cache.claim_refresh(user_id):
+                refresh_user_resumes.delay(user_id)
+            return cached.items
+
+        credentials = await self.repo.get_hh_credentials(user_id)
+        if not credentials or not credentials.access_token:
             raise Exception("HH Account not connected")
 
-        return await self.hh_service.get_my_resumes(profile.access_token)
+        entry = await resume_cache.fetch(self.hh_service, user_id, credentials.access_token)
+        return entry.items
 
     async def save_hh_tokens(self, user_id: int, tokens: HHTokenDTO, hh_id: int) -> None:
         """
@@ -92,4 +202,82 @@ class VacancyService:
             hh_id=hh_id,
             access_token=tokens.access_token,
             refresh_token=tokens.refresh_token
-        )
\ No newline at end of file
+        )
+        await resume_cache.invalidate(user_id)
+
+    async def get_applications(
+            self,
+            user_id: int,
+            filters: ApplicationFilterDTO,
+            limit: int = 100,
+            cursor: Optional[str] = None
+    ) -> ApplicationPageDTO:
+        """
+        Returns a page of the user's application history, newest first.
+
+        Raises:
+            PaginationError: If the limit is out of range or the cursor is invalid.
+        """
+        if limit <= 0 or limit > self.MAX_PAGE_SIZE:
+            raise PaginationError(f"Limit must be between 1 and {self.MAX_PAGE_SIZE}")
+
+        before = None
+        if cursor:
+            created_at, pk = decode_cursor(cursor, 2)
+            try:
+                before = (datetime.fromisoformat(created_at), int(pk))
+            except (TypeError, ValueError):
+                raise PaginationError("Invalid cursor")
+
+        models = await self.repo.get_applications_page(user_id, filters, limit + 1, before)
+        items = [ApplicationLogDTO.model_validate(model) for model in models[:limit]]
+        next_cursor = None
+        if len(models) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+        return ApplicationPageDTO(items=items, next_cursor=next_cursor)
+
+    async def export_applications(
+            self,
+            user_id: int,
+            filters: ApplicationFilterDTO,
+            fmt: Literal["csv", "ndjson"] = "csv"
+    ) -> AsyncIterator[str]:
+        """
+        Yields the user's full application history as CSV or NDJSON chunks.
+
+        Rows are read through a server-side cursor, so memory use does not
+        depend on the size of the history.
+        """
+        applications = self.repo.stream_applications(user_id, filters)
+
+        if fmt == "ndjson":
+            async for model in applications:
+                yield ApplicationLogDTO.model_validate(model).model_dump_json() + "\n"
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.EXPORT_FIELDS)
+        async for model in applications:
+            writer.writerow((model.id, model.vacancy_id, model.status, model.created_at.isoformat()))
+            if buffer.tell() >= 64 * 1024:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    async def get_stats(self, user_id: int) -> ApplicationStatsDTO:
+        """
+        Application counts by status for today and the last 7 days, read from the rollup.
+        """
+        today = self.repo.stats_day(datetime.now(timezone.utc))
+        week_start = today - timedelta(days=6)
+
+        today_counts: Counter[str] = Counter()
+        week_counts: Counter[str] = Counter()
+        for day, status, count in await self.repo.get_stats(user_id, week_start):
+            week_counts[status] += count
+            if day == today:
+                today_counts[status] += count
+        return ApplicationStatsDTO(today=dict(today_counts), week=dict(week_counts))
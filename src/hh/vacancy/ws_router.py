@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from redis.exceptions import RedisError
+
+from hh.auth.dependencies.current_user import ICurrentWSUser
+from hh.config.database.session import ISession
+from hh.vacancy.progress import progress_hub, KEEPALIVE_INTERVAL
+
+router = APIRouter(prefix="/ws/vacancies")
+
+
+async def _wait_disconnect(websocket: WebSocket) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+@router.websocket("/progress")
+async def progress_ws(websocket: WebSocket, user: ICurrentWSUser, session: ISession):
+    """Progress of the user's bot runs; only the latest state is delivered to slow clients."""
+    # Authentication is done, don't hold a database connection for the lifetime of the socket
+    await session.close()
+    await websocket.accept()
+
+    disconnected = asyncio.create_task(_wait_disconnect(websocket))
+    try:
+        async with progress_hub.subscribe(user.id) as subscriber:
+            while not disconnected.done():
+                data = await subscriber.next(KEEPALIVE_INTERVAL)
+                if data is not None:
+                    await websocket.send_text(data)
+    except (WebSocketDisconnect, RedisError):
+        pass
+    finally:
+        disconnected.cancel()
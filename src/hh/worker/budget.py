@@ -0,0 +1,78 @@
+import logging
+import time
+import uuid
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+from redis.exceptions import RedisError
+
+from hh.config.worker import settings as worker_settings
+from hh.integration.hh.dto import HHSearchCursorDTO
+from hh.libs.redis.client import redis_helper
+from hh.vacancy.dto import RunProgressDTO
+
+logger = logging.getLogger(__name__)
+
+
+class RunBudget:
+    """
+    Limits of one run slice: wall time and number of applications.
+    """
+
+    def __init__(self, seconds: float, applications: int):
+        """
+        Args:
+            seconds: Wall time the slice may take.
+            applications: Applications the slice may send.
+        """
+        self.deadline = time.monotonic() + seconds
+        self.applications = applications
+
+    def spend(self, applications: int = 1) -> None:
+        self.applications -= applications
+
+    def exhausted(self) -> bool:
+        return self.applications <= 0 or time.monotonic() >= self.deadline
+
+
+class RunCheckpointDTO(BaseModel):
+    """
+    Position of a run that ran out of budget, picked up by its continuation.
+
+    Cursors are keyed by search stream; None means the stream has not started yet.
+    The ID ties the checkpoint to the continuation enqueued for it.
+    """
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    cursors: Dict[str, Optional[HHSearchCursorDTO]]
+    run_yield: int
+    progress: RunProgressDTO
+
+
+def checkpoint_key(user_id: int) -> str:
+    return f"hh:checkpoint:{user_id}"
+
+
+async def load_checkpoint(user_id: int) -> Optional[RunCheckpointDTO]:
+    raw = await redis_helper.client.get(checkpoint_key(user_id))
+    return RunCheckpointDTO.model_validate_json(raw) if raw is not None else None
+
+
+async def save_checkpoint(user_id: int, checkpoint: RunCheckpointDTO) -> None:
+    # A checkpoint outliving the queued timeout belongs to a lost continuation
+    await redis_helper.client.set(
+        checkpoint_key(user_id), checkpoint.model_dump_json(), ex=worker_settings.effective_queued_timeout
+    )
+
+
+async def touch_checkpoint(user_id: int) -> None:
+    """
+    Restarts the checkpoint's expiry when its continuation is enqueued.
+    """
+    await redis_helper.client.expire(checkpoint_key(user_id), worker_settings.effective_queued_timeout)
+
+
+async def clear_checkpoint(user_id: int) -> None:
+    try:
+        await redis_helper.client.delete(checkpoint_key(user_id))
+    except RedisError as e:
+        logger.warning(f"Failed to clear run checkpoint of user {user_id}: {e}")
@@ -0,0 +1,74 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
+
+from hh.config.worker import settings as worker_settings
+from hh.libs.redis.client import redis_helper
+from hh.vacancy.progress import bot_status_key
+from hh.worker.budget import checkpoint_key
+
+# Deletes the lock only if it is still held by the caller
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def run_lock_key(user_id: int) -> str:
+    return f"hh:run:{user_id}"
+
+
+async def acquire_run_lock(user_id: int) -> Optional[str]:
+    """
+    Takes the per-user run lock, so at most one run of a user executes at a time.
+
+    Returns:
+        The lock token to release it with, or None if a run is in progress.
+    """
+    token = uuid.uuid4().hex
+    acquired = await redis_helper.client.set(
+        run_lock_key(user_id), token, nx=True, ex=worker_settings.run_lock_ttl
+    )
+    return token if acquired else None
+
+
+async def release_run_lock(user_id: int, token: str) -> None:
+    await redis_helper.client.eval(_RELEASE_SCRIPT, 1, run_lock_key(user_id), token)
+
+
+async def is_run_in_progress(user_id: int) -> bool:
+    return bool(await redis_helper.client.exists(run_lock_key(user_id)))
+
+
+async def select_idle_users(user_ids: Sequence[int]) -> list[int]:
+    """
+    Drops users whose run is in progress, has a checkpoint waiting for its
+    continuation, or was enqueued less than the queued timeout ago, checking
+    all of them in one round-trip. The timeout does not depend on the dispatch
+    interval, so users waiting behind a bulk queue backlog are not enqueued
+    again on every tick.
+
+    Args:
+        user_ids: Candidate user IDs.
+
+    Returns:
+        User IDs to enqueue, in the given order.
+    """
+    async with redis_helper.client.pipeline(transaction=False) as pipe:
+        for user_id in user_ids:
+            pipe.exists(run_lock_key(user_id), checkpoint_key(user_id))
+            pipe.hmget(bot_status_key(user_id), "state", "queued_at")
+        replies = await pipe.execute()
+
+    queued_since = datetime.now(timezone.utc) - timedelta(seconds=worker_settings.effective_queued_timeout)
+    idle = []
+    for user_id, busy, (state, queued_at) in zip(user_ids, replies[::2], replies[1::2]):
+        if busy:
+            continue
+        # A queued run older than the timeout is assumed lost with its message
+        if state == "queued" and queued_at and datetime.fromisoformat(queued_at) > queued_since:
+            continue
+        idle.append(user_id)
+    return idle
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import Callable, Optional, Iterable, Sequence
+
+from hh.integration.hh.dto import HHVacancyItemDTO
+from hh.vacancy.dto import SearchSettingsDTO
+
+
+@dataclass(frozen=True)
+class FilterContext:
+    """
+    Per-run view of the user's settings, prepared once for cheap per-item checks.
+    """
+    has_cover_letter: bool
+    currency: str
+    salary: Optional[int]
+    excluded_employer_ids: frozenset[str]
+    excluded_title_keywords: tuple[str, ...]
+
+    @classmethod
+    def from_settings(cls, settings: SearchSettingsDTO) -> "FilterContext":
+        return cls(
+            has_cover_letter=bool(settings.cover_letter),
+            currency=settings.currency,
+            salary=settings.salary,
+            excluded_employer_ids=frozenset(settings.excluded_employer_ids or ()),
+            excluded_title_keywords=tuple(
+                keyword.lower() for keyword in settings.excluded_title_keywords or () if keyword
+            ),
+        )
+
+
+# A filter returns the reason to skip the vacancy, or None to keep it.
+VacancyFilter = Callable[[HHVacancyItemDTO, FilterContext], Optional[str]]
+
+
+def archived_filter(item: HHVacancyItemDTO, ctx: FilterContext) -> Optional[str]:
+    return "archived" if item.archived else None
+
+
+def test_required_filter(item: HHVacancyItemDTO, ctx: FilterContext) -> Optional[str]:
+    return "test_required" if item.has_test else None
+
+
+def letter_required_filter(item: HHVacancyItemDTO, ctx: FilterContext) -> Optional[str]:
+    if item.response_letter_required and not ctx.has_cover_letter:
+        return "letter_required"
+    return None
+
+
+def currency_filter(item: HHVacancyItemDTO, ctx: FilterContext) -> Optional[str]:
+    # Currency only matters when the user asked for a salary
+    if ctx.salary is None or not item.salary:
+        return None
+    currency = item.salary.get("currency")
+    if currency and currency != ctx.currency:
+        return "currency_mismatch"
+    return None
+
+
+def employer_blacklist_filter(item: HHVacancyItemDTO, ctx: FilterContext) -> Optional[str]:
+    if ctx.excluded_employer_ids and str(item.employer.get("id")) in ctx.excluded_employer_ids:
+        return "employer_excluded"
+    return None
+
+
+def title_keyword_filter(item: HHVacancyItemDTO, ctx: FilterContext) -> Optional[str]:
+    if not ctx.excluded_title_keywords:
+        return None
+    title = item.name.lower()
+    if any(keyword in title for keyword in ctx.excluded_title_keywords):
+        return "title_excluded"
+    return None
+
+
+DEFAULT_FILTERS: tuple[VacancyFilter, ...] = (
+    archived_filter,
+    test_required_filter,
+    letter_required_filter,
+    currency_filter,
+    employer_blacklist_filter,
+    title_keyword_filter,
+)
+
+
+class VacancyPreFilter:
+    """
+    Drops vacancies that are bound to be rejected, using only search result fields.
+
+    Runs locally before any /negotiations call, so every filtered vacancy saves
+    an upstream request.
+    """
+
+    def __init__(self, settings: SearchSettingsDTO, filters: Sequence[VacancyFilter] = DEFAULT_FILTERS):
+        """
+        Args:
+            settings: The user's search settings.
+            filters: Filter functions evaluated in order; the first reason wins.
+        """
+        self.ctx = FilterContext.from_settings(settings)
+        self.filters = tuple(filters)
+
+    def check(self, item: HHVacancyItemDTO) -> Optional[str]:
+        """
+        Returns the reason the vacancy should be skipped, or None to apply.
+        """
+        for vacancy_filter in self.filters:
+            reason = vacancy_filter(item, self.ctx)
+            if reason is not None:
+                return reason
+        return None
+
+    def filter(self, items: Iterable[HHVacancyItemDTO]) -> list[HHVacancyItemDTO]:
+        """
+        Returns only the vacancies that passed every filter.
+        """
+        return [item for item in items if self.check(item) is None]
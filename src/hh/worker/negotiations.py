@@ -0,0 +1,73 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+from hh.integration.hh.service import HHIntegrationService
+from hh.vacancy.dto import ApplicationRecordDTO, VacancyDTO
+from hh.vacancy.repository.vacancy import VacancyRepository
+
+logger = logging.getLogger(__name__)
+
+# Status of applications found on HH that were not sent by the bot
+SYNCED_STATUS = "synced_external"
+NEGOTIATIONS_PER_PAGE = 100
+
+
+async def sync_negotiations(
+        hh_service: HHIntegrationService,
+        repo: VacancyRepository,
+        user_id: int,
+        token: str,
+        since: Optional[datetime] = None
+) -> int:
+    """
+    Copies the user's HH negotiations into the application history.
+
+    Negotiations are listed most recently updated first, so paging stops at the
+    first one not updated since the previous sync. Every page is written with one
+    insert; vacancies already in the history are left as they are. The marker is
+    moved only after a complete sync, an interrupted one is repeated from the start.
+
+    Args:
+        hh_service: Service to communicate with HH.
+        repo: Repository to write the history to.
+        user_id: The ID of the user.
+        token: Valid access token.
+        since: Marker of the previous sync, None to copy everything.
+
+    Returns:
+        Number of negotiations updated since the previous sync.
+
+    Raises:
+        UnauthorizedError: If the token is rejected.
+    """
+    newest = since
+    synced = 0
+    page = 0
+
+    while True:
+        result = await hh_service.get_negotiations(token, page, NEGOTIATIONS_PER_PAGE)
+        fresh = [item for item in result.items if since is None or item.updated_at > since]
+
+        # Negotiations of deleted vacancies have no vacancy to skip
+        existing = [item for item in fresh if item.vacancy]
+        if existing:
+            await repo.upsert_vacancies(VacancyDTO.from_hh(item.vacancy) for item in existing)
+            await repo.log_applications(user_id, [
+                ApplicationRecordDTO(vacancy_id=str(item.vacancy["id"]), status=SYNCED_STATUS, created_at=item.created_at)
+                for item in existing
+            ])
+
+        for item in fresh:
+            if newest is None or item.updated_at > newest:
+                newest = item.updated_at
+        synced += len(fresh)
+
+        if len(fresh) < len(result.items) or page + 1 >= result.pages:
+            break
+        page += 1
+
+    if newest is not None and newest != since:
+        await repo.update_negotiations_marker(user_id, newest)
+    logger.info(f"Synced {synced} negotiations of user {user_id}")
+    return synced
@@ -0,0 +1,114 @@
+import zlib
+from typing import Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from hh.integration.hh.dto import HHVacancyItemDTO
+from hh.libs.text import tokenize
+
+
+N_FEATURES = 2 ** 18
+
+
+def resume_text(resume: dict) -> str:
+    """
+    Collects the free-text parts of an HH resume (title, skills, experience).
+    """
+    parts = [resume.get("title") or "", resume.get("skills") or ""]
+    parts.extend(resume.get("skill_set") or [])
+    for experience in resume.get("experience") or []:
+        parts.append(experience.get("position") or "")
+        parts.append(experience.get("description") or "")
+    return " ".join(parts)
+
+
+def vacancy_text(item: HHVacancyItemDTO) -> str:
+    """
+    Collects the searchable text of a vacancy from a search result item.
+    """
+    snippet = item.snippet or {}
+    return " ".join((
+        item.name,
+        snippet.get("requirement") or "",
+        snippet.get("responsibility") or "",
+    ))
+
+
+class ResumeRanker:
+    """
+    Orders vacancies by TF-IDF cosine similarity to the user's resume.
+
+    Documents are hashed into a fixed-size bag-of-words space so no vocabulary
+    has to be kept between pages. IDF is computed over the page being scored,
+    which down-weights the words every result shares (usually the search query).
+    """
+
+    def __init__(self, resume: str, threshold: Optional[float] = None, n_features: int = N_FEATURES):
+        """
+        Args:
+            resume: Free text of the resume.
+            threshold: Minimum score to keep a vacancy, or None to keep all.
+            n_features: Size of the hashed feature space (power of two).
+        """
+        self.n_features = n_features
+        self.threshold = threshold
+        self._resume = self._term_frequencies([resume])
+
+    def _term_frequencies(self, docs: Sequence[str]) -> sparse.csr_matrix:
+        rows: list[int] = []
+        cols: list[int] = []
+        mask = self.n_features - 1
+        for row, doc in enumerate(docs):
+            for token in tokenize(doc):
+                rows.append(row)
+                # crc32 is stable across processes, unlike hash()
+                cols.append(zlib.crc32(token.encode()) & mask)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(cols), dtype=np.float32), (rows, cols)),
+            shape=(len(docs), self.n_features),
+        )
+        matrix.sum_duplicates()
+        np.log1p(matrix.data, out=matrix.data)
+        return matrix
+
+    @staticmethod
+    def _normalize(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms) @ matrix
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Scores a batch of documents against the resume.
+
+        Args:
+            texts: Vacancy texts of one search page.
+
+        Returns:
+            Cosine similarities in [0, 1], one per text.
+        """
+        if not texts:
+            return np.zeros(0, dtype=np.float32)
+
+        page = self._term_frequencies(texts)
+        df = np.bincount(page.indices, minlength=self.n_features)
+        idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+
+        page.data *= idf[page.indices]
+        resume = self._resume.multiply(idf).tocsr()
+
+        scores = self._normalize(page) @ self._normalize(resume).T
+        return scores.toarray().ravel()
+
+    def rank(self, items: Sequence[HHVacancyItemDTO]) -> list[HHVacancyItemDTO]:
+        """
+        Returns the items best match first, without those under the threshold.
+        """
+        scores = self.score([vacancy_text(item) for item in items])
+        order = np.argsort(-scores, kind="stable")
+        return [
+            items[i] for i in order
+            if self.threshold is None or scores[i] >= self.threshold
+        ]
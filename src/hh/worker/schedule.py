@@ -0,0 +1,29 @@
+from typing import Optional
+
+from hh.config.worker import settings as worker_settings
+
+
+def next_run_interval(current: Optional[int], run_yield: Optional[int]) -> int:
+    """
+    Computes the interval until a user's next periodic run.
+
+    Runs that found no new vacancies multiply the interval by the schedule
+    factor, runs that found at least the target yield divide it, anything in
+    between keeps it, and so do skipped runs. The result stays within the
+    configured bounds.
+
+    Args:
+        current: The current interval in seconds, None before the first run.
+        run_yield: New unprocessed vacancies found by the finished run, None
+            if the run was skipped without searching.
+
+    Returns:
+        The new interval in seconds.
+    """
+    interval = float(current or worker_settings.schedule_initial_interval)
+    if run_yield == 0:
+        interval *= worker_settings.schedule_factor
+    elif run_yield is not None and run_yield >= worker_settings.schedule_target_yield:
+        interval /= worker_settings.schedule_factor
+
+    return int(min(max(interval, worker_settings.schedule_min_interval), worker_settings.schedule_max_interval))
@@ -0,0 +1,100 @@
+import hashlib
+from collections import defaultdict
+from typing import Iterable
+
+from hh.integration.hh.dto import HHVacancyItemDTO
+from hh.libs.text import tokenize
+from hh.worker.ranking import vacancy_text
+
+
+SIGNATURE_BITS = 64
+_MASK = (1 << SIGNATURE_BITS) - 1
+# Weight of the employer feature relative to a single text shingle
+EMPLOYER_WEIGHT = 2
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(features: Iterable[tuple[str, int]]) -> int:
+    """
+    Computes a 64-bit SimHash of weighted features.
+
+    Args:
+        features: Pairs of (feature, weight).
+
+    Returns:
+        Unsigned 64-bit signature; similar inputs differ in few bits.
+    """
+    totals = [0] * SIGNATURE_BITS
+    for feature, weight in features:
+        value = _feature_hash(feature)
+        for bit in range(SIGNATURE_BITS):
+            totals[bit] += weight if value >> bit & 1 else -weight
+
+    signature = 0
+    for bit, total in enumerate(totals):
+        if total > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def vacancy_signature(item: HHVacancyItemDTO) -> int:
+    """
+    SimHash over the employer id and word bigrams of the title and snippet.
+    """
+    tokens = tokenize(vacancy_text(item))
+    features = [(f"employer:{item.employer.get('id')}", EMPLOYER_WEIGHT)]
+    features.extend((" ".join(pair), 1) for pair in zip(tokens, tokens[1:]))
+    if len(tokens) == 1:
+        features.append((tokens[0], 1))
+    return simhash(features)
+
+
+def to_signed(signature: int) -> int:
+    """Maps an unsigned 64-bit signature to the BIGINT range for storage."""
+    return signature - (1 << SIGNATURE_BITS) if signature >> (SIGNATURE_BITS - 1) else signature
+
+
+def to_unsigned(signature: int) -> int:
+    """Inverse of to_signed."""
+    return signature & _MASK
+
+
+class SimHashIndex:
+    """
+    LSH index for finding signatures within a small Hamming distance.
+
+    Signatures are split into max_distance + 1 bands; by the pigeonhole principle
+    two signatures at distance <= max_distance share at least one band exactly,
+    so only signatures from matching buckets need a full comparison.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self._band_bits = -(-SIGNATURE_BITS // self.bands)
+        self._band_mask = (1 << self._band_bits) - 1
+        self._buckets: list[dict[int, list[int]]] = [defaultdict(list) for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets[0].values())
+
+    def _keys(self, signature: int) -> Iterable[tuple[int, int]]:
+        for band in range(self.bands):
+            yield band, signature >> (band * self._band_bits) & self._band_mask
+
+    def add(self, signature: int) -> None:
+        for band, key in self._keys(signature):
+            self._buckets[band][key].append(signature)
+
+    def contains_near(self, signature: int) -> bool:
+        """
+        Returns True if a stored signature is within max_distance bits.
+        """
+        for band, key in self._keys(signature):
+            for candidate in self._buckets[band].get(key, ()):
+                if (candidate ^ signature).bit_count() <= self.max_distance:
+                    return True
+        return False
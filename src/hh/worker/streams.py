@@ -0,0 +1,47 @@
+import logging
+from typing import AsyncIterator, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+async def interleave(streams: dict[K, AsyncIterator[T]]) -> AsyncIterator[tuple[K, T]]:
+    """
+    Yields the items of several async iterators in round-robin order.
+
+    Each stream gets one turn per round, so a long search does not delay
+    the others. A stream that fails is logged and dropped, the rest go on.
+    Finished and failed streams are removed from the streams dict, which
+    leaves the streams still in progress in it. Streams are closed when the
+    generator is closed.
+
+    Args:
+        streams: The iterators to interleave by key, in the order of their turns.
+
+    Yields:
+        The key of the stream and its next item.
+    """
+    try:
+        while streams:
+            for key in list(streams):
+                try:
+                    item = await anext(streams[key])
+                except StopAsyncIteration:
+                    await _close(streams.pop(key))
+                    continue
+                except Exception as e:
+                    logger.error(f"Stream {key} failed: {e}")
+                    await _close(streams.pop(key))
+                    continue
+                yield key, item
+    finally:
+        for stream in streams.values():
+            await _close(stream)
+
+
+async def _close(stream: AsyncIterator) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
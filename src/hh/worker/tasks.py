@@ -1,18 +1,52 @@
 import asyncio
 import logging
-import json
-from celery import Task
-
-from hh.config.celery import celery_app
+import math
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, TypeVar
+from celery import Task, group
+
+from hh.config.celery import celery_app, BULK_QUEUE
+from hh.config.worker import settings as worker_settings
+from hh.config.headhunter import settings as hh_settings
 from hh.config.database.engine import db_helper
 from hh.integration.hh.service import HHIntegrationService
-from hh.integration.hh.dto import HHNegotiationPayloadDTO, HHTokenDTO
+from hh.integration.hh.dto import HHNegotiationPayloadDTO
+from hh.integration.hh.errors import (
+    ALREADY_APPLIED,
+    FAILURE_POLICIES,
+    FailureScope,
+    classify_negotiation_error,
+)
+from hh.vacancy.dictionaries import build_snapshot, write_snapshot
+from hh.vacancy.cover_letter import CoverLetterTemplate, CoverLetterTemplateError
+from hh.vacancy.dto import ApplicationRecordDTO, RunProgressDTO, VacancyDTO
+from hh.vacancy.progress import publish_progress, mark_idle, mark_queued, mark_continuing
 from hh.vacancy.repository.vacancy import VacancyRepository
-from hh.libs.http.client import AsyncHttpClient
+from hh.vacancy.resumes import resume_cache
+from hh.libs.redis.client import redis_helper
 from hh.libs.http.exceptions import UnauthorizedError, HttpStatusCodeError
+from hh.worker.budget import (
+    RunBudget,
+    RunCheckpointDTO,
+    load_checkpoint,
+    save_checkpoint,
+    touch_checkpoint,
+    clear_checkpoint,
+)
+from hh.worker.dispatcher import acquire_run_lock, release_run_lock, select_idle_users
+from hh.worker.filters import VacancyPreFilter
+from hh.worker.negotiations import sync_negotiations
+from hh.worker.ranking import ResumeRanker, resume_text
+from hh.worker.schedule import next_run_interval
+from hh.worker.tokens import refresh_access_token
+from hh.worker.similarity import SimHashIndex, vacancy_signature, to_signed, to_unsigned
+from hh.worker.streams import interleave
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class AutoApplyTask(Task):
     """
@@ -22,151 +56,663 @@ class AutoApplyTask(Task):
     retry_kwargs = {'max_retries': 3, 'countdown': 60}
 
 
-async def _refresh_access_token(
-        hh_service: HHIntegrationService,
+async def _run_task(coro: Awaitable[T]) -> T:
+    """
+    Runs a task coroutine and closes clients bound to its event loop.
+
+    Every task invocation gets a fresh loop from asyncio.run, so pooled Redis
+    connections must not outlive it.
+    """
+    try:
+        return await coro
+    finally:
+        await redis_helper.close()
+
+
+async def _record_negotiation_error(
         repo: VacancyRepository,
         user_id: int,
-        refresh_token: str
-) -> HHTokenDTO:
+        vacancy_id: str,
+        error: HttpStatusCodeError,
+        signature: int | None = None
+) -> ApplicationRecordDTO | None:
+    """
+    Handles a rejected application so the vacancy is skipped next time.
+
+    'already_applied' becomes an application record for the caller to write,
+    permanent failures go to the negative cache with the TTL and scope of their
+    error class. Anything else is considered transient and only logged.
+
+    Args:
+        repo: Repository to update DB.
+        user_id: ID of the user owner.
+        vacancy_id: The external vacancy ID.
+        error: The error raised by POST /negotiations.
+        signature: Signed SimHash of the vacancy, stored with the application.
+
+    Returns:
+        The application record to write, or None if the attempt failed.
+    """
+    reason = classify_negotiation_error(error)
+
+    if reason == ALREADY_APPLIED:
+        return ApplicationRecordDTO(vacancy_id=vacancy_id, status="already_applied_external", signature=signature)
+
+    policy = FAILURE_POLICIES.get(reason)
+    if policy is None:
+        logger.error(f"HTTP Error applying to {vacancy_id}: {error}")
+        return None
+
+    await repo.record_failure(
+        vacancy_id=vacancy_id,
+        reason=reason,
+        expires_at=datetime.now(timezone.utc) + policy.ttl,
+        user_id=user_id if policy.scope == FailureScope.USER else None
+    )
+    logger.info(f"Vacancy {vacancy_id} skipped for user {user_id}: {reason}")
+    return None
+
+
+async def _load_ranker(
+        hh_service: HHIntegrationService,
+        token: str,
+        resume_id: str,
+        threshold: float | None
+) -> ResumeRanker | None:
+    """
+    Builds the relevance ranker from the user's resume.
+
+    Ranking is an optimization, so a failure to fetch the resume only disables it.
+
+    Args:
+        hh_service: Service to communicate with HH.
+        token: Valid access token.
+        resume_id: The resume used for applications.
+        threshold: Minimum relevance to apply, or None.
+
+    Returns:
+        The ranker, or None if the resume could not be loaded.
+    """
+    try:
+        resume = await hh_service.get_resume(token, resume_id)
+    except Exception as e:
+        logger.warning(f"Failed to load resume {resume_id}, ranking disabled: {e}")
+        return None
+    return await asyncio.to_thread(ResumeRanker, resume_text(resume), threshold)
+
+
+async def _load_near_duplicate_index(repo: VacancyRepository, user_id: int) -> SimHashIndex:
+    """
+    Builds the LSH index of the user's applications within the near-duplicate window.
+
+    Args:
+        repo: Repository to read applications.
+        user_id: ID of the user owner.
+
+    Returns:
+        Index with the signatures of recent applications.
+    """
+    index = SimHashIndex(worker_settings.near_duplicate_max_distance)
+    since = datetime.now(timezone.utc) - timedelta(days=worker_settings.near_duplicate_window_days)
+    for signature in await repo.get_recent_signatures(user_id, since):
+        index.add(to_unsigned(signature))
+    return index
+
+
+async def _has_resume(
+        hh_service: HHIntegrationService,
+        user_id: int,
+        resume_id: str,
+        token: str,
+        refresh_tokens: Callable[[str], Awaitable[str]]
+) -> bool:
     """
-    Refreshes the HH tokens and updates the database.
+    Checks the configured resume against the cached resume list.
+
+    Without a cached list the resume is assumed valid: the check must not cost
+    an upstream call, and a wrong ID still fails on the first application.
+    A cached list may predate the resume, so the list is fetched again before
+    the resume is reported missing.
 
     Args:
         hh_service: Service to communicate with HH.
+        user_id: The ID of the user.
+        resume_id: The resume of the user's settings.
+        token: Valid access token.
+        refresh_tokens: Called with the rejected token after a 401, returns a fresh access token.
+    """
+    cached = await resume_cache.get(user_id)
+    if cached is None or _lists_resume(cached.items, resume_id):
+        return True
+
+    try:
+        try:
+            fresh = await resume_cache.fetch(hh_service, user_id, token)
+        except UnauthorizedError:
+            fresh = await resume_cache.fetch(hh_service, user_id, await refresh_tokens(token))
+    except Exception as e:
+        logger.warning(f"Failed to reload resumes of user {user_id}: {e}")
+        return True
+    return _lists_resume(fresh.items, resume_id)
+
+
+def _lists_resume(resumes: list[dict], resume_id: str) -> bool:
+    return any(str(resume.get("id")) == resume_id for resume in resumes)
+
+
+async def _remaining_quota(repo: VacancyRepository, user_id: int) -> int:
+    """
+    Applications left today under the HH daily limit, read from the rollup.
+    """
+    today = repo.stats_day(datetime.now(timezone.utc))
+    applied = sum(
+        count for _, status, count in await repo.get_stats(user_id, today) if status == "applied"
+    )
+    return max(0, worker_settings.daily_application_limit - applied)
+
+
+async def _schedule_next_run(
+        repo: VacancyRepository,
+        user_id: int,
+        current_interval: int | None,
+        run_yield: int | None
+) -> datetime:
+    """
+    Stores when the user's next periodic run is due, adapted to the yield of the finished run.
+
+    Args:
         repo: Repository to update DB.
         user_id: ID of the user owner.
-        refresh_token: The expired refresh token.
+        current_interval: Interval that led to this run, in seconds.
+        run_yield: New unprocessed vacancies found by this run, None if it was
+            skipped, which keeps the interval.
 
     Returns:
-        The new token DTO.
+        The time of the next run.
+    """
+    interval = next_run_interval(current_interval, run_yield)
+    next_run_at = datetime.now(timezone.utc) + timedelta(seconds=interval)
+    await repo.update_schedule(user_id, next_run_at, interval, run_yield)
+    return next_run_at
+
 
-    Raises:
-        UnauthorizedError: If the refresh token is also invalid.
+def _compile_cover_letter(user_id: int, source: str | None) -> CoverLetterTemplate:
     """
-    new_tokens = await hh_service.refresh_token(refresh_token)
-    await repo.update_tokens(user_id, new_tokens.access_token, new_tokens.refresh_token)
-    logger.info(f"Tokens refreshed for user {user_id}")
-    return new_tokens
+    Compiles the user's cover letter template once per run.
 
+    Letters saved before templating was validated are sent verbatim.
+    """
+    try:
+        return CoverLetterTemplate(source or "")
+    except CoverLetterTemplateError as e:
+        logger.warning(f"Invalid cover letter template for user {user_id}, sending as is: {e}")
+        return CoverLetterTemplate.literal(source or "")
 
-async def _process_user_async(user_id: int):
+
+async def _process_user_async(
+        user_id: int,
+        scheduled: bool = False,
+        continuation: str | None = None
+) -> str | None:
     """
     Main asynchronous logic for processing a user's vacancy applications.
 
-    Iterates through search pages and applies to vacancies. Handles pagination,
-    token refreshing on 401 errors, and graceful skipping of duplicate applications.
+    The settings query and every active saved search are paged in round-robin
+    order (interleave), each split into publication date partitions past HH's
+    result cap (SearchPlanner). Every page is pre-filtered (VacancyPreFilter),
+    stripped of processed vacancies and near-duplicates, ranked by relevance
+    to the resume (ResumeRanker) and applied to; outcomes are written as they
+    happen. HH negotiations are synced into the history before a new run
+    (sync_negotiations), and tokens are refreshed on 401 (refresh_access_token).
+    Progress is published after every application and page, and the next
+    periodic run is scheduled from the run's yield (next_run_interval).
+
+    A run is executed in slices bounded by RunBudget. A slice that exhausts it
+    saves a checkpoint and is continued by a task tagged with the checkpoint's
+    ID, which is dropped if the checkpoint is gone.
 
     Args:
         user_id: The ID of the user to process.
+        scheduled: Whether the run was enqueued by the dispatcher; such runs are
+            dropped if another run has already moved the user's schedule forward.
+        continuation: ID of the checkpoint the run continues from.
+
+    Returns:
+        The ID of the saved checkpoint if the run ran out of budget and must be
+        continued, otherwise None.
     """
-    http_client = AsyncHttpClient()
-    hh_service = HHIntegrationService(http_client=http_client)
+    hh_service = HHIntegrationService()
 
     async with db_helper.session_factory() as session:
         repo = VacancyRepository(session)
 
-        hh_profile = await repo.get_hh_profile(user_id)
-        settings = await repo.get_settings(user_id)
+        checkpoint = await load_checkpoint(user_id)
+        if continuation is not None and (checkpoint is None or checkpoint.id != continuation):
+            logger.info(f"Continuation of user {user_id} dropped: its checkpoint is gone")
+            # A replaced checkpoint belongs to a newer continuation, which owns the status
+            if checkpoint is None:
+                await mark_idle(user_id)
+            await hh_service.close()
+            return None
+
+        hh_profile, settings = await repo.get_run_context(user_id)
 
-        if not hh_profile or not hh_profile.is_bot_active or not settings:
+        credentials = await repo.get_hh_credentials(user_id) if hh_profile else None
+        if not credentials or not hh_profile.is_bot_active or not settings:
             logger.info(f"Bot inactive or no settings for user {user_id}")
+            await clear_checkpoint(user_id)
+            await mark_idle(user_id)
             await hh_service.close()
-            return
-
-        current_token = hh_profile.access_token
-        current_refresh_token = hh_profile.refresh_token
+            return None
 
-        page = 0
-        while True:
+        if scheduled and hh_profile.next_run_at and hh_profile.next_run_at > datetime.now(timezone.utc):
+            logger.info(f"Scheduled run of user {user_id} superseded by an earlier run")
+            await mark_idle(user_id)
+            await hh_service.close()
+            return None
+
+        current_token = credentials.access_token
+        pre_filter = VacancyPreFilter(settings)
+        cover_letter = _compile_cover_letter(user_id, settings.cover_letter)
+        ranker: ResumeRanker | None = None
+        ranker_loaded = False
+        near_duplicates = await _load_near_duplicate_index(repo, user_id)
+        budget = RunBudget(worker_settings.run_time_budget, worker_settings.run_application_budget)
+        out_of_budget = False
+
+        refresh_lock = asyncio.Lock()
+
+        async def log_applied(vacancy_id: str, signature: int) -> None:
+            # Written right after the POST, so a slice that fails later does not apply again
+            await repo.log_applications(user_id, [
+                ApplicationRecordDTO(vacancy_id=vacancy_id, status="applied", signature=to_signed(signature))
+            ])
+            near_duplicates.add(signature)
+            progress.applied += 1
+            progress.quota_remaining = max(0, progress.quota_remaining - 1)
+            budget.spend()
+
+        async def refresh_tokens(stale_token: str) -> str:
+            # Searches and applications run concurrently; only the first caller
+            # rejected with the current token goes to the shared refresh
+            nonlocal current_token
+            async with refresh_lock:
+                if stale_token == current_token:
+                    current_token = await refresh_access_token(hh_service, repo, user_id, stale_token)
+            return current_token
+
+        if not await _has_resume(hh_service, user_id, settings.resume_id, current_token, refresh_tokens):
+            logger.warning(f"Resume {settings.resume_id} not found among resumes of user {user_id}")
+            # Not a zero-yield run: nothing was searched, the interval stays
+            await _schedule_next_run(repo, user_id, hh_profile.run_interval, None)
+            await clear_checkpoint(user_id)
+            await mark_idle(user_id)
+            await hh_service.close()
+            return None
+
+        queries = {"settings": (settings.search_text, {"area": settings.area_id, "salary": settings.salary})}
+        for search in await repo.get_saved_searches(user_id, active_only=True):
+            queries[f"search:{search.id}"] = (search.search_text, {
+                "area": search.area_id,
+                "salary": search.salary,
+                "schedule": search.schedule,
+                "employment": search.employment,
+            })
+
+        if checkpoint is not None:
+            cursors, run_yield, progress = checkpoint.cursors, checkpoint.run_yield, checkpoint.progress
+            # Searches finished before the checkpoint or added since wait for the next run
+            queries = {key: query for key, query in queries.items() if key in cursors}
+            logger.info(f"Continuing run of user {user_id}: {len(queries)} searches left")
+        else:
+            cursors, run_yield, progress = {key: None for key in queries}, 0, RunProgressDTO()
             try:
-                search_res = await hh_service.search_vacancies(
-                    token=current_token,
-                    text=settings.search_text,
-                    area=settings.area_id,
-                    salary=settings.salary,
-                    page=page
-                )
-            except UnauthorizedError:
                 try:
-                    tokens = await _refresh_access_token(hh_service, repo, user_id, current_refresh_token)
-                    current_token = tokens.access_token
-                    current_refresh_token = tokens.refresh_token
-                    continue
-                except Exception as e:
-                    logger.error(f"Failed to refresh token for user {user_id}: {e}")
-                    break
+                    await sync_negotiations(hh_service, repo, user_id, current_token, hh_profile.negotiations_synced_at)
+                except UnauthorizedError:
+                    await refresh_tokens(current_token)
+                    await sync_negotiations(hh_service, repo, user_id, current_token, hh_profile.negotiations_synced_at)
             except Exception as e:
-                logger.error(f"Search failed for user {user_id} on page {page}: {e}")
-                break
-
-            if not search_res.items:
-                break
+                logger.warning(f"Negotiations sync failed for user {user_id}: {e}")
+        progress.quota_remaining = await _remaining_quota(repo, user_id)
+        await publish_progress(user_id, progress)
+
+        streams = {
+            key: hh_service.iter_vacancy_pages(
+                token=current_token,
+                text=text,
+                filters=filters,
+                on_unauthorized=refresh_tokens,
+                cursor=cursors[key]
+            )
+            for key, (text, filters) in queries.items()
+        }
+        # Vacancies found by an earlier page of any search in this slice
+        seen: set[str] = set()
+
+        pages = interleave(streams)
+        async with aclosing(pages):
+            while True:
+                try:
+                    key, (position, search_res) = await anext(pages)
+                except StopAsyncIteration:
+                    break
 
-            for item in search_res.items:
-                if await repo.is_applied(user_id, item.id):
+                cursors[key] = position.next(search_res.pages)
+                items = [item for item in search_res.items if item.id not in seen]
+                seen.update(item.id for item in items)
+                if not items:
                     continue
+                progress.page += 1
+                # Applications of this page reference the stored vacancies
+                await repo.upsert_vacancies(VacancyDTO.from_hh(item.model_dump()) for item in items)
+
+                if not ranker_loaded:
+                    # The token is known to be valid after a successful search
+                    ranker = await _load_ranker(hh_service, current_token, settings.resume_id, settings.min_relevance)
+                    ranker_loaded = True
+
+                candidates = pre_filter.filter(items)
+                processed = await repo.get_processed_vacancy_ids(
+                    user_id, (item.id for item in candidates)
+                )
+                candidates = [item for item in candidates if item.id not in processed]
+                run_yield += len(candidates)
 
-                try:
+                if ranker is not None and candidates:
+                    candidates = await asyncio.to_thread(ranker.rank, candidates)
+                progress.skipped += len(items) - len(candidates)
+
+                # Failed attempts of this page, counted in the statistics once the page is done
+                errors = 0
+
+                for item in candidates:
+                    if budget.exhausted():
+                        out_of_budget = True
+                        break
+
+                    signature = vacancy_signature(item)
+                    if near_duplicates.contains_near(signature):
+                        logger.info(f"Vacancy {item.id} skipped for user {user_id}: near duplicate")
+                        progress.skipped += 1
+                        continue
+
+                    token = current_token
                     payload = HHNegotiationPayloadDTO(
                         vacancy_id=item.id,
                         resume_id=settings.resume_id,
-                        message=settings.cover_letter or ""
+                        message=cover_letter.render(item)
                     )
-                    await hh_service.apply_for_vacancy(current_token, payload)
-                    await repo.log_application(user_id, item.id, "applied")
-                    logger.info(f"Applied to vacancy {item.id} for user {user_id}")
-
-                    await asyncio.sleep(2)
-
-                except UnauthorizedError:
+                    # Only the POST is guarded, a failed write of its outcome is not a failed application
                     try:
-                        tokens = await _refresh_access_token(hh_service, repo, user_id, current_refresh_token)
-                        current_token = tokens.access_token
-                        current_refresh_token = tokens.refresh_token
+                        await hh_service.apply_for_vacancy(token, payload)
 
-                        await hh_service.apply_for_vacancy(current_token, payload)
-                        await repo.log_application(user_id, item.id, "applied")
+                    except UnauthorizedError:
+                        try:
+                            await hh_service.apply_for_vacancy(await refresh_tokens(token), payload)
+                        except Exception as e:
+                            errors += 1
+                            logger.error(f"Retry application failed after refresh for {item.id}: {e}")
+                        else:
+                            await log_applied(item.id, signature)
+
+                    except HttpStatusCodeError as e:
+                        record = await _record_negotiation_error(repo, user_id, item.id, e, to_signed(signature))
+                        if record is None:
+                            errors += 1
+                        else:
+                            await repo.log_applications(user_id, [record])
 
                     except Exception as e:
-                        logger.error(f"Retry application failed after refresh for {item.id}: {e}")
+                        errors += 1
+                        logger.error(f"Unexpected error applying to {item.id}: {e}")
 
-                except HttpStatusCodeError as e:
-                    error_type = "error"
-                    if e.status_code == 403:
-                        try:
-                            # Attempt to parse HH error body to check for duplicate
-                            body_json = json.loads(e.response_body or "{}")
-                            errors = body_json.get("errors", [])
-                            for err in errors:
-                                if err.get("value") == "already_applied":
-                                    error_type = "already_applied_external"
-                                    break
-                        except json.JSONDecodeError:
-                            pass
-
-                    if error_type == "already_applied_external":
-                        await repo.log_application(user_id, item.id, error_type)
                     else:
-                        logger.error(f"HTTP Error applying to {item.id}: {e}")
+                        await log_applied(item.id, signature)
+                        logger.info(f"Applied to vacancy {item.id} for user {user_id}")
+                        await publish_progress(user_id, progress)
 
-                except Exception as e:
-                    logger.error(f"Unexpected error applying to {item.id}: {e}")
+                        await asyncio.sleep(2)
 
-            page += 1
-            if page >= search_res.pages:
-                break
+                if errors:
+                    await repo.log_applications(user_id, [], errors)
+                progress.errors += errors
+                await publish_progress(user_id, progress)
+
+                # An interrupted page is searched again by the continuation, its
+                # applied vacancies are deduplicated there
+                if out_of_budget:
+                    cursors[key] = position
+                    break
+
+                if budget.exhausted():
+                    out_of_budget = True
+                    break
 
-            await asyncio.sleep(1)
+                await asyncio.sleep(1)
+
+        if out_of_budget:
+            # Searches that failed or reached their last page are dropped from streams
+            cursors = {
+                key: cursors[key] for key in streams
+                if cursors[key] is None or cursors[key].windows
+            }
+            out_of_budget = bool(cursors)
+
+        if out_of_budget:
+            checkpoint = RunCheckpointDTO(cursors=cursors, run_yield=run_yield, progress=progress)
+            await save_checkpoint(user_id, checkpoint)
+            await mark_continuing(user_id)
+            logger.info(f"Run of user {user_id} out of budget, continuing later")
+        else:
+            await clear_checkpoint(user_id)
+            progress.state = "finished"
+            progress.next_run_at = await _schedule_next_run(repo, user_id, hh_profile.run_interval, run_yield)
+            await publish_progress(user_id, progress)
 
     await hh_service.close()
+    return checkpoint.id if out_of_budget else None
+
+
+async def _process_user_locked(user_id: int, scheduled: bool = False, continuation: str | None = None):
+    """
+    Runs _process_user_async under the user's run lock; skips the run if
+    another one of the same user is in progress.
+
+    A run that ran out of budget is re-enqueued at the back of the bulk queue
+    once the lock is released, so waiting users get a slot in between. Its
+    checkpoint is kept alive for the queued timeout from then on.
+    """
+    token = await acquire_run_lock(user_id)
+    if token is None:
+        logger.info(f"Run of user {user_id} already in progress, skipped")
+        return
+    try:
+        checkpoint_id = await _process_user_async(user_id, scheduled, continuation)
+    finally:
+        await release_run_lock(user_id, token)
+
+    if checkpoint_id is not None:
+        await touch_checkpoint(user_id)
+        process_user_vacancies.apply_async(
+            args=[user_id], kwargs={"continuation": checkpoint_id}, queue=BULK_QUEUE
+        )
 
 
 @celery_app.task(base=AutoApplyTask, bind=True)
-def process_user_vacancies(self, user_id: int):
+def process_user_vacancies(self, user_id: int, scheduled: bool = False, continuation: str | None = None):
     """
     Celery task entry point to process vacancies for a specific user.
 
     Args:
         user_id: The ID of the user.
+        scheduled: Whether the run was enqueued by the dispatcher.
+        continuation: ID of the checkpoint, for continuations of runs out of budget.
+    """
+    asyncio.run(_run_task(_process_user_locked(user_id, scheduled, continuation)))
+
+
+async def _refresh_resumes_async(user_id: int):
+    """
+    Reloads the user's cached resume list from HH, refreshing the token on 401.
+
+    Args:
+        user_id: The ID of the user to process.
+    """
+    hh_service = HHIntegrationService()
+    try:
+        async with db_helper.session_factory() as session:
+            repo = VacancyRepository(session)
+            credentials = await repo.get_hh_credentials(user_id)
+            if not credentials or not credentials.access_token:
+                return
+
+            try:
+                await resume_cache.fetch(hh_service, user_id, credentials.access_token)
+            except UnauthorizedError:
+                token = await refresh_access_token(hh_service, repo, user_id, credentials.access_token)
+                await resume_cache.fetch(hh_service, user_id, token)
+    finally:
+        await resume_cache.release_refresh(user_id)
+        await hh_service.close()
+
+
+@celery_app.task(base=AutoApplyTask, bind=True)
+def refresh_user_resumes(self, user_id: int):
+    """
+    Celery task entry point to refresh the cached resumes of a user.
+
+    Args:
+        user_id: The ID of the user.
+    """
+    asyncio.run(_run_task(_refresh_resumes_async(user_id)))
+
+
+async def _sync_negotiations_async(user_id: int):
+    """
+    Copies the user's new HH negotiations into the history, refreshing the token on 401.
+
+    Args:
+        user_id: The ID of the user to process.
+    """
+    hh_service = HHIntegrationService()
+    try:
+        async with db_helper.session_factory() as session:
+            repo = VacancyRepository(session)
+            hh_profile = await repo.get_hh_profile(user_id)
+            credentials = await repo.get_hh_credentials(user_id)
+            if not hh_profile or not credentials or not credentials.access_token:
+                return
+
+            since = hh_profile.negotiations_synced_at
+            try:
+                await sync_negotiations(hh_service, repo, user_id, credentials.access_token, since)
+            except UnauthorizedError:
+                token = await refresh_access_token(hh_service, repo, user_id, credentials.access_token)
+                await sync_negotiations(hh_service, repo, user_id, token, since)
+    finally:
+        await hh_service.close()
+
+
+@celery_app.task(base=AutoApplyTask, bind=True)
+def sync_user_negotiations(self, user_id: int):
+    """
+    Celery task entry point to sync the HH negotiations of a user.
+
+    Args:
+        user_id: The ID of the user.
+    """
+    asyncio.run(_run_task(_sync_negotiations_async(user_id)))
+
+
+async def _dispatch_runs_async() -> int:
+    """
+    Splits the users whose next run is due into batches and schedules one
+    enqueue_runs task per batch, evenly spread over the dispatch interval.
+
+    Users are read in keyset chunks, so memory and broker load stay bounded
+    by the batch size however many users are active.
+
+    Returns:
+        Number of scheduled batches.
+    """
+    batch_size = worker_settings.dispatch_batch_size
+
+    async with db_helper.session_factory() as session:
+        repo = VacancyRepository(session)
+        now = datetime.now(timezone.utc)
+        total = await repo.count_due_users(now)
+        spacing = worker_settings.dispatch_interval / max(1, math.ceil(total / batch_size))
+
+        batches = 0
+        after_user_id = 0
+        while True:
+            user_ids = await repo.get_due_user_ids(now, after_user_id, batch_size)
+            if not user_ids:
+                break
+            enqueue_runs.apply_async(args=[user_ids], countdown=int(batches * spacing))
+            after_user_id = user_ids[-1]
+            batches += 1
+
+    logger.info(f"Dispatched {total} due users in {batches} batches")
+    return batches
+
+
+async def _enqueue_runs_async(user_ids: list[int]) -> int:
+    """
+    Enqueues runs of a batch of users, skipping those with a run in progress.
+
+    Returns:
+        Number of enqueued runs.
+    """
+    idle = await select_idle_users(user_ids)
+    if idle:
+        await mark_queued(*idle)
+        group(process_user_vacancies.s(user_id, scheduled=True) for user_id in idle).apply_async(queue=BULK_QUEUE)
+    return len(idle)
+
+
+@celery_app.task
+def dispatch_scheduled_runs():
+    """
+    Celery beat entry point that schedules periodic runs of all active users.
+    """
+    return asyncio.run(_run_task(_dispatch_runs_async()))
+
+
+@celery_app.task
+def enqueue_runs(user_ids: list[int]):
+    """
+    Celery task entry point to enqueue runs of one dispatch batch.
+
+    Args:
+        user_ids: IDs of the users in the batch.
+    """
+    return asyncio.run(_run_task(_enqueue_runs_async(user_ids)))
+
+
+async def _refresh_dictionaries_async() -> int:
+    """
+    Downloads HH areas and dictionaries and replaces the local snapshot.
+
+    Returns:
+        Number of areas in the snapshot.
+    """
+    hh_service = HHIntegrationService()
+    try:
+        areas, dictionaries = await asyncio.gather(hh_service.get_areas(), hh_service.get_dictionaries())
+    finally:
+        await hh_service.close()
+
+    snapshot = build_snapshot(areas, dictionaries)
+    await asyncio.to_thread(write_snapshot, hh_settings.dictionaries_path, snapshot)
+    logger.info(f"HH dictionaries snapshot written: {len(snapshot['areas'])} areas")
+    return len(snapshot["areas"])
+
+
+@celery_app.task(base=AutoApplyTask, bind=True)
+def refresh_hh_dictionaries(self):
+    """
+    Celery beat entry point that refreshes the snapshot of HH areas and dictionaries.
     """
-    asyncio.run(_process_user_async(user_id))
\ No newline at end of file
+    return asyncio.run(_run_task(_refresh_dictionaries_async()))
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import uuid
+
+from hh.integration.hh.service import HHIntegrationService
+from hh.libs.http.exceptions import UnauthorizedError
+from hh.libs.redis.client import redis_helper
+from hh.vacancy.repository.vacancy import VacancyRepository
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of one refresh; a crashed holder blocks the others at most this long
+REFRESH_LOCK_TTL = 30
+REFRESH_LOCK_POLL_INTERVAL = 0.1
+
+# Deletes the lock only if it is still held by the caller
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def refresh_lock_key(user_id: int) -> str:
+    return f"hh:token_refresh:{user_id}"
+
+
+async def refresh_access_token(
+        hh_service: HHIntegrationService,
+        repo: VacancyRepository,
+        user_id: int,
+        stale_token: str
+) -> str:
+    """
+    Replaces an access token rejected by HH, shared by every task of the user.
+
+    HH refresh tokens are single-use, and runs, resume reloads and negotiation
+    syncs of a user may run at the same time in different processes. Refreshes
+    of a user are serialized by a Redis lock; under it the tokens are read from
+    the database, and HH is asked for new ones only if the stored access token
+    is still the rejected one. Otherwise another task has already refreshed
+    them and the stored token is returned.
+
+    Args:
+        hh_service: Service to communicate with HH.
+        repo: Repository to read and update the tokens.
+        user_id: ID of the user owner.
+        stale_token: The access token rejected with 401.
+
+    Returns:
+        A valid access token.
+
+    Raises:
+        UnauthorizedError: If HH is not connected or the refresh token is also invalid.
+    """
+    key = refresh_lock_key(user_id)
+    lock = uuid.uuid4().hex
+    while not await redis_helper.client.set(key, lock, nx=True, ex=REFRESH_LOCK_TTL):
+        await asyncio.sleep(REFRESH_LOCK_POLL_INTERVAL)
+
+    try:
+        credentials = await repo.get_hh_credentials(user_id)
+        if credentials is None:
+            raise UnauthorizedError(401, "HH account not connected")
+        if credentials.access_token != stale_token:
+            return credentials.access_token
+
+        new_tokens = await hh_service.refresh_token(credentials.refresh_token)
+        await repo.update_tokens(user_id, new_tokens.access_token, new_tokens.refresh_token)
+        logger.info(f"Tokens refreshed for user {user_id}")
+        return new_tokens.access_token
+    finally:
+        await redis_helper.client.eval(_RELEASE_SCRIPT, 1, key, lock)
@@ -0,0 +1,103 @@
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from hh.integration.hh.dto import HHSearchResultsDTO, HHSearchWindowDTO
+from hh.integration.hh.planner import MAX_RESULTS, MIN_WINDOW, SEARCH_PERIOD, SearchPlanner
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+class StubHHService:
+    """
+    Serves search_vacancies from a fixed list of publication dates, with HH's
+    inclusive date bounds and result cap.
+    """
+
+    def __init__(self, published: list[datetime]):
+        self.published = sorted(published, reverse=True)
+
+    def count(self, window: HHSearchWindowDTO) -> int:
+        return len(self._select(window.date_from, window.date_to))
+
+    def _select(self, date_from: Optional[datetime], date_to: Optional[datetime]) -> list[datetime]:
+        return [
+            published for published in self.published
+            if (date_from is None or published >= date_from) and (date_to is None or published <= date_to)
+        ]
+
+    async def search_vacancies(self, token, text, page, per_page, date_from=None, date_to=None, **filters):
+        await asyncio.sleep(0)
+        for value in (date_from, date_to):
+            assert value is None or "." not in value, f"fractional date sent: {value}"
+        found = self._select(
+            datetime.fromisoformat(date_from) if date_from else None,
+            datetime.fromisoformat(date_to) if date_to else None,
+        )
+        visible = found[:MAX_RESULTS]
+        return HHSearchResultsDTO.model_validate({
+            "items": [
+                {"id": str(int(published.timestamp())), "name": "", "employer": {}, "alternate_url": ""}
+                for published in visible[page * per_page:(page + 1) * per_page]
+            ],
+            "found": len(found),
+            "pages": -(-len(visible) // per_page),
+            "page": page,
+        })
+
+
+def published_dates(count: int, days: int) -> list[datetime]:
+    seconds = random.Random(count).sample(range(1, days * 86_400), count)
+    return [NOW - timedelta(seconds=second) for second in seconds]
+
+
+def plan(service: StubHHService):
+    return asyncio.run(SearchPlanner(service, "token", "python", {}).plan())
+
+
+def test_over_cap_search_splits_into_disjoint_leaves_under_the_cap():
+    service = StubHHService(published_dates(12_000, days=100))
+
+    windows = [partition.window for partition in plan(service)]
+
+    assert len(windows) > 1
+    assert all(service.count(window) <= MAX_RESULTS for window in windows)
+    # Newest first, every leaf starting where the next older one ends
+    assert windows[0].date_to == NOW
+    assert windows[-1].date_from is None
+    for newer, older in zip(windows, windows[1:]):
+        assert newer.date_from == older.date_to
+        assert newer.date_from.microsecond == 0
+
+
+def test_paging_the_plan_yields_every_vacancy_once():
+    published = published_dates(12_000, days=100)
+    service = StubHHService(published)
+
+    async def collect():
+        ids = []
+        async for _, results in SearchPlanner(service, "token", "python", {}).iter_pages():
+            ids.extend(item.id for item in results.items)
+        return ids
+
+    ids = asyncio.run(collect())
+
+    assert len(ids) == len(set(ids)) == len(published)
+
+
+def test_only_the_first_partition_keeps_its_probe_page():
+    partitions = plan(StubHHService(published_dates(6_000, days=20)))
+
+    assert partitions[0].first_page is not None
+    assert all(partition.first_page is None for partition in partitions[1:])
+
+
+def test_dense_window_is_not_split_below_the_minimum():
+    # More results within one second than the cap, no split can get under it
+    service = StubHHService([NOW - SEARCH_PERIOD / 2] * (MAX_RESULTS + 1))
+
+    windows = [partition.window for partition in plan(service)]
+
+    bounded = [window for window in windows if window.date_from is not None]
+    assert all(window.date_to - window.date_from >= MIN_WINDOW for window in bounded)
@@ -0,0 +1,93 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from hh.libs.http.throttler import RedisFairThrottler
+
+KEY = "api.hh.ru"
+
+
+def make_throttler(rate: float, flow_rate: float = 1000) -> RedisFairThrottler:
+    redis = SimpleNamespace(client=fakeredis.FakeAsyncRedis(decode_responses=True))
+    return RedisFairThrottler(redis, namespace=f"test:{uuid.uuid4().hex}", rate=rate, flow_rate=flow_rate)
+
+
+def queue_keys(throttler: RedisFairThrottler) -> tuple[str, ...]:
+    prefix = f"{throttler.namespace}:{KEY}"
+    return f"{prefix}:waiters", f"{prefix}:leases", f"{prefix}:tags", f"{prefix}:bucket", f"{prefix}:clock"
+
+
+def test_backlogged_flows_share_the_rate_equally():
+    async def scenario():
+        throttler = make_throttler(rate=10)
+        granted = []
+
+        async def request(flow: str):
+            await throttler.acquire(KEY, flow)
+            granted.append(flow)
+
+        # The long backlog outlasts the initial burst, the short one is queued behind it
+        tasks = [asyncio.create_task(request("long")) for _ in range(20)]
+        await asyncio.sleep(0.05)
+        backlogged_at = len(granted)
+        tasks += [asyncio.create_task(request("short")) for _ in range(4)]
+        await asyncio.gather(*tasks)
+        return granted, backlogged_at
+
+    granted, backlogged_at = asyncio.run(scenario())
+
+    assert len(granted) == 24
+    assert backlogged_at < 20
+    # Grants alternate while both flows are backlogged, whatever the tie order
+    assert granted[backlogged_at:backlogged_at + 8].count("short") == 4
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        throttler = make_throttler(rate=1)
+        client = throttler.redis.client
+        waiters = queue_keys(throttler)[0]
+
+        # Takes the only token, the next request has to queue
+        await throttler.acquire(KEY, "a")
+        task = asyncio.create_task(throttler.acquire(KEY, "b"))
+        await asyncio.sleep(0.1)
+        queued = await client.zcard(waiters)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return queued, await client.zcard(waiters), await client.hlen(queue_keys(throttler)[1])
+
+    queued, left, leases = asyncio.run(scenario())
+
+    assert queued == 1
+    assert left == 0
+    assert leases == 0
+
+
+def test_waiter_that_stops_polling_is_evicted_after_its_lease():
+    async def scenario():
+        throttler = make_throttler(rate=100)
+        client = throttler.redis.client
+        waiters, leases = queue_keys(throttler)[:2]
+
+        # A waiter of a killed process at the head of the queue, its lease about to run out
+        seconds, microseconds = await client.time()
+        await client.zadd(waiters, {"dead": 0.5})
+        await client.hset(leases, "dead", seconds + microseconds / 1_000_000 + 0.3)
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        await asyncio.wait_for(throttler.acquire(KEY, "live"), timeout=3)
+        return loop.time() - started_at, await client.zscore(waiters, "dead")
+
+    waited, dead = asyncio.run(scenario())
+
+    assert waited >= 0.2
+    assert dead is None